@@ -9,6 +9,13 @@ to keep config.example.json in sync.
 import json
 from munin_client.config import MuninConfig
 
+# Optional: orjson for faster serialization (falls back to stdlib json)
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
 def generate_example_config():
     """Generate example config file from MuninConfig defaults"""
     config = MuninConfig()
@@ -21,8 +28,12 @@ def generate_example_config():
     }
     
     # Write to config.example.json with nice formatting
-    with open('config.example.json', 'w') as f:
-        json.dump(example_config, f, indent=2)
+    if HAS_ORJSON:
+        with open('config.example.json', 'wb') as f:
+            f.write(orjson.dumps(example_config, option=orjson.OPT_INDENT_2))
+    else:
+        with open('config.example.json', 'w') as f:
+            json.dump(example_config, f, indent=2)
     
     print("Generated config.example.json from MuninConfig defaults")
     print("Face colors:")
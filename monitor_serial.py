@@ -9,20 +9,32 @@ import sys
 import time
 import signal
 import argparse
-from datetime import datetime
+
+def _fmt_now():
+    """Return the current local time as HH:MM:SS.mmm."""
+    now = time.time()
+    return "%s.%03d" % (time.strftime("%H:%M:%S", time.localtime(now)), int(now % 1 * 1000))
 
 class SerialMonitor:
-    def __init__(self, port='/dev/cu.usbmodem101', baudrate=115200, timeout=1):
+    def __init__(self, port='/dev/cu.usbmodem101', baudrate=115200, timeout=0.2):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.ser = None
         self.running = False
+        # Pending log lines, written in batches instead of flushing per line
+        self._log_buf = []
+        self._last_flush = time.monotonic()
+        # Received bytes not yet terminated by a newline
+        self._rx = bytearray()
         
     def connect(self):
         """Connect to the serial port."""
         try:
             self.ser = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+            if sys.platform == 'win32':
+                # Larger driver-side receive buffer; other platforms use pyserial's default
+                self.ser.set_buffer_size(rx_size=65536)
             print(f"Connected to {self.port} at {self.baudrate} baud")
             print("Press Ctrl+C to exit")
             print("-" * 50)
@@ -37,6 +49,13 @@ class SerialMonitor:
             self.ser.close()
             print(f"\nDisconnected from {self.port}")
     
+    def _flush_log(self, log_handle):
+        """Write buffered log lines in a single call."""
+        if self._log_buf:
+            log_handle.write(''.join(self._log_buf))
+            self._log_buf.clear()
+        self._last_flush = time.monotonic()
+
     def monitor(self, show_timestamps=False, log_file=None):
         """Monitor serial output."""
         if not self.connect():
@@ -46,34 +65,48 @@ class SerialMonitor:
         log_handle = None
         
         if log_file:
-            log_handle = open(log_file, 'a')
+            log_handle = open(log_file, 'a', buffering=65536)
             print(f"Logging to {log_file}")
         
+        ser = self.ser
+        rx = self._rx
+        fmt_now = _fmt_now
+        need_ts = show_timestamps or log_handle is not None
+        log_buf = self._log_buf
+        append = log_buf.append
+        monotonic = time.monotonic
+        out = print
+
         try:
             while self.running:
                 try:
-                    if self.ser.in_waiting > 0:
-                        try:
-                            line = self.ser.readline().decode('utf-8', errors='replace').rstrip()
-                            if line:
-                                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+                    # Read whatever is buffered (blocks up to the timeout for the first byte)
+                    data = ser.read(max(1, ser.in_waiting))
+                    if data:
+                        rx += data
+                        end = rx.rfind(b'\n')
+                        if end >= 0:
+                            # Decode all complete lines in one go
+                            text = rx[:end].decode('utf-8', errors='replace')
+                            del rx[:end + 1]
+                            for line in text.split('\n'):
+                                line = line.rstrip()
+                                if not line:
+                                    continue
+                                timestamp = fmt_now() if need_ts else None
                                 
                                 if show_timestamps:
                                     output = f"[{timestamp}] {line}"
                                 else:
                                     output = line
                                     
-                                print(output)
+                                out(output)
                                 
                                 if log_handle:
-                                    log_handle.write(f"[{timestamp}] {line}\n")
-                                    log_handle.flush()
-                                    
-                        except UnicodeDecodeError:
-                            # Skip invalid characters
-                            pass
-                    else:
-                        time.sleep(0.01)  # Small delay to prevent excessive CPU usage
+                                    append(f"[{timestamp}] {line}\n")
+
+                    if log_buf and (len(log_buf) >= 128 or monotonic() - self._last_flush > 0.2):
+                        self._flush_log(log_handle)
                 except (OSError, serial.SerialException) as e:
                     print(f"\nSerial connection lost: {e}")
                     break
@@ -83,6 +116,7 @@ class SerialMonitor:
             self.running = False
         finally:
             if log_handle:
+                self._flush_log(log_handle)
                 log_handle.close()
             self.disconnect()
             
@@ -1,12 +1,23 @@
 import argparse
 from munin_client.tray import start_tray
 
+# Optional: uvloop as the asyncio event loop (Linux/macOS; falls back to the default loop)
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except Exception:
+    HAS_UVLOOP = False
+
 def main():
     parser = argparse.ArgumentParser(description="Munin BLE Time Tracking Client")
     parser.add_argument("--fake", action="store_true", 
                        help="Start a fake Munin device for testing")
     args = parser.parse_args()
     
+    if HAS_UVLOOP:
+        # Every asyncio.run() in the tray and BLE worker threads then gets a uvloop loop
+        uvloop.install()
+    
     # Pass the fake device flag to the tray
     start_tray(enable_fake_device=args.fake)
 
@@ -1,28 +1,74 @@
+from __future__ import annotations
+
 import asyncio
+import functools
+import re
+import time
 from typing import List, Optional, Tuple
-import bleak
-from bleak import BleakScanner, BleakClient
 from munin_client.logger import MuninLogger
 from munin_client.config import MuninConfig
-from munin_client.device import MuninDevice, MuninDeviceImpl, FakeMuninDevice
+from munin_client.device import MuninDevice, MuninDeviceImpl, FakeMuninDevice, FaceConfig
 
 logger = MuninLogger()
 
+# bleak pulls in heavy platform backends; it is imported on first scan/connect
+BleakScanner = BleakClient = None
+
+def _bleak():
+    """Import bleak on first use and bind its names at module level"""
+    global BleakScanner, BleakClient
+    if BleakClient is None:
+        from bleak import BleakScanner, BleakClient
+
 class BLEDeviceManager:
+    # Munin-specific UUIDs
+    MUNIN_FACE_SERVICE_UUID = "6e400001-8a3a-11e5-8994-feff819cdc9f"
+    MUNIN_FACE_CHAR_UUID = "6e400002-8a3a-11e5-8994-feff819cdc9f"
+    # Match values for the scan callback: pre-lowered UUID, case-insensitive name search (no per-ad .lower())
+    _MUNIN_FACE_SERVICE_UUID_LC = MUNIN_FACE_SERVICE_UUID.lower()
+    _MUNIN_NAME_SEARCH = re.compile(r"munin", re.IGNORECASE).search
+
+    # Standard BLE Battery Service UUID
+    BATTERY_SERVICE_UUID = "0000180f-0000-1000-8000-00805f9b34fb"
+    BATTERY_LEVEL_CHAR_UUID = "00002a19-0000-1000-8000-00805f9b34fb"
+
+    __slots__ = (
+        'config', 'client', 'connected_device', '_connected_cached',
+        'battery_level', 'is_charging', 'battery_voltage',
+        '_pending_send_config', '_need_push_after_reconnect',
+        '_last_request_ts', '_debounce_s',
+        '_face_configs_cache', '_face_configs_version', '_last_good_op_ts',
+        '_scanners',
+        '_scan_task', '_scan_cache',
+        'fake_device',
+    )
+
     def __init__(self, enable_fake_device: bool = False):
-        self.config = MuninConfig()
+        self.config = MuninConfig()  # shared process-wide instance
         self.client = None  # type: Optional[BleakClient]
         self.connected_device = None  # type: Optional[MuninDevice]
+        # Connection state; set on connect, cleared by disconnect / Bleak's disconnect callback
+        self._connected_cached = False
         self.battery_level = None  # type: Optional[int]
         self.is_charging = False
         self.battery_voltage = None  # type: Optional[float]
         # Internal flags
         self._pending_send_config = False
         self._need_push_after_reconnect = False
+        # Color push requests are coalesced until this much quiet time has passed
+        self._last_request_ts = 0.0
+        self._debounce_s = 0.2
+        # FaceConfig list built from config, rebuilt when MuninConfig._version changes
+        self._face_configs_cache = []  # type: List[FaceConfig]
+        self._face_configs_version = -1
+        self._last_good_op_ts = 0.0  # monotonic time of last successful device I/O
 
-        # Munin-specific UUIDs
-        self.MUNIN_FACE_SERVICE_UUID = "6e400001-8a3a-11e5-8994-feff819cdc9f"
-        self.MUNIN_FACE_CHAR_UUID = "6e400002-8a3a-11e5-8994-feff819cdc9f"
+        # Shared scanner (created lazily per event loop) and per-scan result state
+        # event loop -> (BleakScanner, sink); sink[0] is the detection handler of the scan running on that loop
+        self._scanners = {}
+        # Single-flight scan task and (monotonic ts, timeout, devices) of the last full scan
+        self._scan_task = None  # type: Optional[asyncio.Task]
+        self._scan_cache = (float('-inf'), None, [])
 
         # Fake device support
         self.fake_device = None  # type: Optional[FakeMuninDevice]
@@ -30,97 +76,183 @@ class BLEDeviceManager:
             self.fake_device = FakeMuninDevice(ble_manager=self)
             logger.log_event("Fake Munin device enabled for testing")
 
-        # Standard BLE Battery Service UUID
-        self.BATTERY_SERVICE_UUID = "0000180f-0000-1000-8000-00805f9b34fb"
-        self.BATTERY_LEVEL_CHAR_UUID = "00002a19-0000-1000-8000-00805f9b34fb"
-
     def refresh_config_from_disk(self):
-        """Force reload of configuration from disk for this manager's instance.
+        """Reload configuration from disk if the file changed since the last load/save.
 
-        Tray's global MuninConfig is a different instance; ensure our cached
-        copy is also refreshed so we don't send stale colors.
+        The settings editor runs in its own process, so the shared MuninConfig
+        must re-read the file to avoid sending stale colors. The file mtime
+        is compared first so an unchanged config is not re-parsed.
         """
         try:
-            # Bust cache and reload
-            self.config._config = None
-            self.config.load_config()
-            logger.log_event("BLE manager config refreshed from disk", "debug")
+            if self.config.reload_if_changed():
+                logger.log_event("BLE manager config refreshed from disk", level="debug")
         except Exception as e:
-            logger.log_event(f"Failed to refresh config from disk: {e}")
+            logger.log_event("Failed to refresh config from disk: %s", e)
     
-    async def scan_for_devices(self, timeout: float = 5.0) -> List[Tuple[str, str, str]]:
-        """Scan for BLE devices and return list of (name, address, rssi) for Munin devices only"""
-        logger.log_event(f"Scanning for Munin devices for {timeout}s...")
-        devices = []
-        
+    def _on_detect(self, found: dict, found_evt: asyncio.Event, device, adv):
+        """Record a Munin advertisement into one scan's results (bound per scan with functools.partial)."""
+        name = device.name or "Unknown"
+
+        # Check if device advertises the Munin face service
+        # (AdvertisementData.service_uuids is already normalized to lowercase by bleak)
+        has_munin_service = self._MUNIN_FACE_SERVICE_UUID_LC in adv.service_uuids
+
+        # Also check if device name contains "Munin" as fallback
+        is_munin_device = has_munin_service or self._MUNIN_NAME_SEARCH(name) is not None
+
+        # Only add Munin devices to the list
+        if is_munin_device:
+            address = device.address
+            rssi = adv.rssi
+            prev = found.get(address)
+            if prev is None:
+                if logger.is_debug_enabled():
+                    logger.log_event("Found Munin device: %s (%s) RSSI: %s Service: %s", name, address, rssi, has_munin_service, level="debug")
+                found[address] = (name, address, rssi)
+                found_evt.set()
+            elif rssi is not None and (prev[2] is None or rssi > prev[2]):
+                # Repeated advertisements collapse into one entry with the best RSSI
+                found[address] = (name, address, rssi)
+
+    async def scan_for_devices(self, timeout: Optional[float] = None, stop_on_first: bool = False) -> List[Tuple[str, str, Optional[int]]]:
+        """Scan for BLE devices and return list of (name, address, rssi) for Munin devices only
+
+        RSSI is an int in dBm (None if unknown); the list is sorted strongest first.
+
+        Advertisements are checked as they arrive. With stop_on_first the scan
+        ends on the first Munin match instead of waiting out the full timeout.
+        One BleakScanner is kept and restarted for each scan on the same loop.
+        The timeout defaults to the configured ui_preferences.scan_timeout.
+
+        Calls made while a scan is running on the same loop share its result,
+        and a full scan with the same timeout that finished less than 2 s ago
+        is returned from cache instead of turning the radio on again.
+        """
+        if timeout is None:
+            timeout = self.config.get_scan_timeout()
+        task = self._scan_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return list(await asyncio.shield(task))
+        cached_ts, cached_timeout, cached_devices = self._scan_cache
+        if cached_timeout == timeout and time.monotonic() - cached_ts < 2.0:
+            return list(cached_devices)
+
+        task = asyncio.create_task(self._scan(timeout, stop_on_first))
+        self._scan_task = task
         try:
-            discovered = await BleakScanner.discover(timeout=timeout)
-            logger.log_event(f"BLE scan completed, found {len(discovered)} raw devices")
-            
-            for device in discovered:
-                name = device.name or "Unknown"
-                address = device.address
-                rssi = getattr(device, 'rssi', None)
-                
-                # Check if device advertises the Munin face service
-                advertised_services = getattr(device, 'metadata', {}).get('uuids', [])
-                has_munin_service = any(
-                    uuid.lower() == self.MUNIN_FACE_SERVICE_UUID.lower() 
-                    for uuid in advertised_services
-                )
-                
-                # Also check if device name contains "Munin" as fallback
-                is_munin_device = has_munin_service or 'munin' in name.lower()
-                
-                # Only add Munin devices to the list
-                if is_munin_device:
-                    logger.log_event(f"Found Munin device: {name} ({address}) RSSI: {rssi} Service: {has_munin_service}")
-                    devices.append((name, address, str(rssi) if rssi is not None else "Unknown"))
-                
+            devices = await asyncio.shield(task)
+        finally:
+            if self._scan_task is task and task.done():
+                self._scan_task = None
+        if not stop_on_first:
+            # A stop-on-first scan may have ended early, so only full scans are cached
+            self._scan_cache = (time.monotonic(), timeout, devices)
+        return list(devices)
+
+    def _scanner_for_loop(self, loop):
+        """Return the (BleakScanner, sink) pair kept for loop, creating it on first use"""
+        entry = self._scanners.get(loop)
+        if entry is None:
+            # Drop scanners left behind by finished loops (e.g. one-off tray scans)
+            for old_loop in list(self._scanners):
+                if old_loop.is_closed():
+                    self._scanners.pop(old_loop, None)
+            sink = [None]
+
+            def detection_callback(device, adv):
+                on_detect = sink[0]
+                if on_detect is not None:
+                    on_detect(device, adv)
+
+            # Service UUID filter lets the OS drop non-Munin advertisements where supported
+            scanner = BleakScanner(detection_callback=detection_callback, service_uuids=[self.MUNIN_FACE_SERVICE_UUID])
+            entry = self._scanners[loop] = (scanner, sink)
+        return entry
+
+    async def _scan(self, timeout: float, stop_on_first: bool) -> List[Tuple[str, str, Optional[int]]]:
+        """Run one scan window; see scan_for_devices"""
+        _bleak()
+        logger.log_event("Scanning for Munin devices for %ss...", timeout)
+        # Results are local to this scan; scans on other threads' loops use their own scanner
+        found = {}  # address -> (name, address, rssi)
+        found_evt = asyncio.Event()
+        sink = None
+
+        try:
+            scanner, sink = self._scanner_for_loop(asyncio.get_running_loop())
+            sink[0] = functools.partial(self._on_detect, found, found_evt)
+            await scanner.start()
+            try:
+                if stop_on_first:
+                    try:
+                        await asyncio.wait_for(found_evt.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    await asyncio.sleep(timeout)
+            finally:
+                await scanner.stop()
         except Exception as e:
-            logger.log_event(f"Error scanning for devices: {e}")
+            logger.log_event("Error scanning for devices: %s", e)
+        finally:
+            if sink is not None:
+                sink[0] = None
+
+        devices = list(found.values())
         
         # Add fake device if enabled
         if self.fake_device:
-            fake_device_info = (self.fake_device.name, self.fake_device.address, "-30")
+            fake_device_info = (self.fake_device.name, self.fake_device.address, -30)
             devices.append(fake_device_info)
-            logger.log_event(f"Added fake device to scan results: {self.fake_device.name}")
+            logger.log_event("Added fake device to scan results: %s", self.fake_device.name)
         
-        logger.log_event(f"Final device list: {len(devices)} Munin devices")
+        # Strongest advertiser first (unknown RSSI last) so callers taking [0] get the best link
+        devices.sort(key=lambda d: d[2] if d[2] is not None else -999, reverse=True)
+        logger.log_event("Final device list: %s Munin devices", len(devices))
         return devices
     
-    async def find_munin_devices(self) -> List[Tuple[str, str, str]]:
+    async def find_munin_devices(self, stop_on_first: bool = False) -> List[Tuple[str, str, Optional[int]]]:
         """Find devices with Munin face service UUID or 'Munin' in the name"""
-        all_devices = await self.scan_for_devices(5.0)
+        all_devices = await self.scan_for_devices(stop_on_first=stop_on_first)
         
         # scan_for_devices already filtered for Munin devices, so just return them
-        logger.log_event(f"Found {len(all_devices)} Munin devices")
+        logger.log_event("Found %s Munin devices", len(all_devices))
         return all_devices
     
     async def connect_to_preferred_device(self) -> bool:
-        """Try to connect to the configured preferred device"""
+        """Try to connect to the configured preferred device, falling back to auto-connect
+
+        The preferred address is connected to directly (no scan) with a short
+        timeout; only if that fails do we pay for a scan via auto_connect_to_munin.
+        """
         device_name, mac_address = self.config.get_preferred_device()
         
         if mac_address:
-            logger.log_event(f"Attempting to connect to preferred device: {device_name} ({mac_address})")
-            return await self.connect_to_device(mac_address, device_name)
+            logger.log_event("Attempting to connect to preferred device: %s (%s)", device_name, mac_address)
+            if await self.connect_to_device(mac_address, device_name, timeout=3.0):
+                return True
+            logger.log_event("Preferred device not reachable, falling back to scan")
         else:
             logger.log_event("No preferred device configured")
-            return False
+        return await self.auto_connect_to_munin()
     
     async def auto_connect_to_munin(self) -> bool:
         """Auto-connect to the first available Munin device"""
-        munin_devices = await self.find_munin_devices()
+        if self.is_connected():
+            # Already connected (e.g. via the preferred-device path)
+            return True
+        
+        munin_devices = await self.find_munin_devices(stop_on_first=True)
         
         if munin_devices:
             name, address, rssi = munin_devices[0]
-            logger.log_event(f"Auto-connecting to first Munin device: {name}")
+            logger.log_event("Auto-connecting to Munin device: %s (RSSI: %s)", name, rssi)
             return await self.connect_to_device(address, name)
         else:
             logger.log_event("No Munin devices found for auto-connect")
             return False
     
-    async def connect_to_device(self, address: str, name: str = None) -> bool:
+    async def connect_to_device(self, address: str, name: str = None, timeout: float = 10.0) -> bool:
         """Connect to a specific device by address"""
         try:
             # Check if this is our fake device
@@ -128,69 +260,113 @@ class BLEDeviceManager:
                 # Use the fake device directly
                 if await self.fake_device.connect():
                     self.connected_device = self.fake_device
-                    self.battery_level = await self.fake_device.read_battery_level()
+                    self._connected_cached = True
+                    # Battery read and color push are independent; issue them together
+                    self.battery_level, _ = await asyncio.gather(
+                        self.fake_device.read_battery_level(),
+                        self._send_face_configuration(),
+                    )
+                    self._need_push_after_reconnect = False
+                    self._last_good_op_ts = time.monotonic()
 
                     return True
                 return False
             
             # Handle real device
-            if self.client and self.client.is_connected:
-                await self.client.disconnect()
-            
-            self.client = BleakClient(address)
-            await self.client.connect()
+            _bleak()
+            await self._safe_disconnect()
             
-            if self.client.is_connected:
+            self.client = BleakClient(address, disconnected_callback=self._on_disconnect, timeout=timeout)
+            try:
+                await self.client.connect()
+                if not self.client.is_connected:
+                    logger.log_event("Failed to connect to %s", address)
+                    return False
+                
                 # Create real device wrapper
                 real_munin = MuninDeviceImpl(name or "Unknown", address, self.client, ble_manager=self)
-                if await real_munin.connect():
-                    self.connected_device = real_munin
-                    self.battery_level = await real_munin.read_battery_level()
-                    # If a config push was requested while disconnected, do it now
-                    if self._need_push_after_reconnect:
-                        await self._send_face_configuration()
-                        self._need_push_after_reconnect = False
-
-                    return True
-                else:
-                    await self.client.disconnect()
+                if not await real_munin.connect():
+                    await self._safe_disconnect()
                     return False
-            else:
-                logger.log_event(f"Failed to connect to {address}")
+                
+                self.connected_device = real_munin
+                self._connected_cached = True
+                # Independent GATT operations: submit both so the stack can pipeline them.
+                # Colors are pushed on every connect since the device keeps them in RAM only.
+                self.battery_level, _ = await asyncio.gather(
+                    real_munin.read_battery_level(),
+                    self._send_face_configuration(),
+                )
+                self._need_push_after_reconnect = False
+                self._last_good_op_ts = time.monotonic()
+
+                return True
+            except Exception as e:
+                # Single cleanup path for any failure after the client was created,
+                # including the battery read / color push, so no link is left half-up
+                logger.log_event("Error connecting to %s: %s", address, e)
+                self._connected_cached = False
+                self.connected_device = None
+                await self._safe_disconnect()
                 return False
         
         except Exception as e:
-            logger.log_event(f"Error connecting to {address}: {e}")
+            logger.log_event("Error connecting to %s: %s", address, e)
             return False
     
+    async def _safe_disconnect(self):
+        """Disconnect the BLE client (at most once) and drop it."""
+        client = self.client
+        if client is None:
+            return
+        try:
+            if client.is_connected:
+                await client.disconnect()
+        except Exception as e:
+            logger.log_event("Error disconnecting BLE client: %s", e, level="debug")
+        finally:
+            self.client = None
+    
     async def disconnect(self, is_temporary: bool = False):
         """Disconnect from current device
         
         Args:
             is_temporary: If True, this is a temporary disconnect (reconnection expected)
+
+        Safe to call repeatedly; each BLE teardown step is bounded to 2 s so a
+        flaky link cannot hang shutdown.
         """
+        self._connected_cached = False
+        if self.connected_device is None and (self.client is None or not self.client.is_connected):
+            return
         try:
             if self.connected_device:
                 # Finalize time tracking session
                 if hasattr(self.connected_device, 'time_tracker'):
                     self.connected_device.time_tracker.finalize_current_session(is_temporary)
                 
-                await self.connected_device.disconnect()
+                try:
+                    await asyncio.wait_for(self.connected_device.disconnect(), timeout=2.0)
+                except asyncio.TimeoutError:
+                    logger.log_event("Device disconnect timed out; forcing teardown", level="warning")
                 device_name = self.connected_device.name
                 
                 if not is_temporary:
                     self.connected_device = None
                     self.battery_level = None
                     
-                logger.log_event(f"Disconnected from {device_name}" + 
-                               (" (temporary)" if is_temporary else ""))
+                logger.log_event("Disconnected from %s%s", device_name,
+                                 " (temporary)" if is_temporary else "")
             
             if self.client and self.client.is_connected:
-                await self.client.disconnect()
+                try:
+                    await asyncio.wait_for(self.client.disconnect(), timeout=2.0)
+                except asyncio.TimeoutError:
+                    logger.log_event("BLE client disconnect timed out; forcing teardown", level="warning")
                 if not is_temporary:
                     self.client = None
         except Exception as e:
-            logger.log_event(f"Error disconnecting: {e}")
+            logger.log_event("Error disconnecting: %s", e)
     
     async def read_battery_level(self) -> Optional[int]:
         """Read battery level from connected device"""
@@ -199,9 +375,11 @@ class BLEDeviceManager:
         
         try:
             self.battery_level = await self.connected_device.read_battery_level()
+            if self.battery_level is not None:
+                self._last_good_op_ts = time.monotonic()
             return self.battery_level
         except Exception as e:
-            logger.log_event(f"Error reading battery level: {e}")
+            logger.log_event("Error reading battery level: %s", e)
             return None
     
     def get_battery_level(self) -> Optional[int]:
@@ -229,35 +407,45 @@ class BLEDeviceManager:
         self.battery_voltage = voltage_mv / 1000.0  # Convert mV to V
         self.battery_level = percentage
         self.is_charging = is_charging
-        logger.log_event(f"Battery status updated: {voltage_mv}mV ({percentage}%), {'charging' if is_charging else 'discharging'}")
+        logger.log_event("Battery status updated: %dmV (%d%%), %s", voltage_mv, percentage,
+                         "charging" if is_charging else "discharging")
+    
+    def _on_disconnect(self, client):
+        """Bleak callback: the BLE link dropped."""
+        if client is self.client:
+            self._connected_cached = False
+            if self.connected_device:
+                self.connected_device.is_connected_flag = False
+            logger.log_event("BLE link lost", level="debug")
     
     def is_connected(self) -> bool:
-        """Check if currently connected to a device"""
-        if self.connected_device is None:
-            return False
-        
-        # For real devices, also check the underlying BLE client
-        if hasattr(self.connected_device, 'client') and self.connected_device.client:
-            try:
-                return self.connected_device.client.is_connected and self.connected_device.is_connected()
-            except Exception:
-                return False
-        
-        return self.connected_device.is_connected()
+        """Check if currently connected to a device (cached; see check_connection_health for a probe)"""
+        return self._connected_cached
     
     async def check_connection_health(self) -> bool:
-        """Perform a deeper connection health check"""
+        """Perform a deeper connection health check
+
+        The cached connection state (cleared by Bleak's disconnect callback) is trusted
+        on its own; a GATT probe is only issued when no device I/O has
+        succeeded in the last 60 seconds. The probe is a 1-byte read rather
+        than the two-characteristic battery read.
+        """
         if not self.is_connected():
             return False
         
+        if time.monotonic() - self._last_good_op_ts < 60.0:
+            return True
+        
         try:
-            # Try to read battery level as a connection test
             # This will fail if the connection is actually dead
-            await self.connected_device.read_battery_level()
+            if not await self.connected_device.ping():
+                raise ConnectionError("device reports not connected")
+            self._last_good_op_ts = time.monotonic()
             return True
         except Exception as e:
-            logger.log_event(f"Connection health check failed: {e}")
+            logger.log_event("Connection health check failed: %s", e)
             # Mark device as disconnected
+            self._connected_cached = False
             if self.connected_device:
                 self.connected_device.is_connected_flag = False
             return False
@@ -277,50 +465,48 @@ class BLEDeviceManager:
     async def _send_face_configuration(self):
         """Send face color configuration from config to device."""
         try:
-            from munin_client.device import FaceConfig
             if not self.connected_device:
                 return
-            # Always reload from disk to avoid stale cached state
-            try:
-                self.config._config = None
-                self.config.load_config()
-            except Exception:
-                pass
-            face_configs = []
-            face_colors = self.config.get_face_colors()
-            for face_id_str in sorted(face_colors.keys(), key=lambda x: int(x)):
-                color = face_colors[face_id_str]
-                face_id = int(face_id_str)
+            # Pick up changes written by other processes (settings editor)
+            self.refresh_config_from_disk()
+            if self._face_configs_version != self.config._version:
+                face_colors = self.config.get_face_colors()
+                items = sorted((int(k), v) for k, v in face_colors.items())
+                self._face_configs_cache = [
+                    FaceConfig(face_id=face_id, r=color["r"], g=color["g"], b=color["b"])
+                    for face_id, color in items
+                ]
+                self._face_configs_version = self.config._version
+            face_configs = self._face_configs_cache
+            if logger.is_debug_enabled():
                 # Debug log the exact color we'll send per face
-                try:
-                    hex_color = f"#{color['r']:02X}{color['g']:02X}{color['b']:02X}"
-                except Exception:
-                    hex_color = "#??????"
-                logger.log_event(
-                    f"Preparing face {face_id}: RGB({color['r']},{color['g']},{color['b']}) {hex_color}",
-                    "debug",
-                )
-                face_config = FaceConfig(
-                    face_id=face_id,
-                    r=color["r"],
-                    g=color["g"],
-                    b=color["b"],
-                )
-                face_configs.append(face_config)
+                for fc in face_configs:
+                    logger.log_event(
+                        "Preparing face %d: RGB(%d,%d,%d) #%02X%02X%02X",
+                        fc.face_id, fc.r, fc.g, fc.b, fc.r, fc.g, fc.b,
+                        level="debug",
+                    )
             if face_configs:
                 success = await self.connected_device.send_face_config(face_configs)
                 if success:
-                    logger.log_event(f"Sent RGB face configuration ({len(face_configs)} faces)")
+                    self._last_good_op_ts = time.monotonic()
+                    logger.log_event("Sent RGB face configuration (%s faces)", len(face_configs))
                 else:
                     logger.log_event("Failed to send face color configuration to device")
             else:
-                logger.log_event("No face colors found in config to send", "warning")
+                logger.log_event("No face colors found in config to send", level="warning")
         except Exception as e:
-            logger.log_event(f"Error sending face configuration: {e}")
+            logger.log_event("Error sending face configuration: %s", e)
 
     # Called from non-async contexts (e.g., tray menu thread) to request a color push
     def send_face_colors_to_device(self):
-        """Schedule sending face colors to the device from the BLE worker loop."""
+        """Schedule sending face colors to the device from the BLE worker loop.
+
+        Requests are debounced: the worker only sends once no new request has
+        arrived for _debounce_s seconds, so a burst of changes results in a
+        single push of the latest colors.
+        """
+        self._last_request_ts = time.monotonic()
         self._pending_send_config = True
         # If we're currently not connected, remember to push immediately after reconnect
         if not self.is_connected():
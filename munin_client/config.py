@@ -1,204 +1,401 @@
+import atexit
+import copy
 import json
 import os
-import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Optional, Any
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Any
 from munin_client.logger import MuninLogger
 
 logger = MuninLogger()
 
+# Optional: orjson for faster (de)serialization (falls back to stdlib json)
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+def _dumps(config: Dict[str, Any]) -> bytes:
+    """Serialize config to indented JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode("utf-8")
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes (orjson errors subclass json.JSONDecodeError)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# SINGLE SOURCE OF TRUTH for all default configuration values
+# Changes here will propagate to new configs and reset operations
+DEFAULT_CONFIG = {
+    "preferred_device_name": None,
+    "preferred_mac_address": None,
+    "face_labels": {
+        "1": "Emails",
+        "2": "Coding", 
+        "3": "Meetings",
+        "4": "Planning",
+        "5": "Break",
+        "6": "Off"
+    },
+    "face_colors": {
+        "1": {"r": 255, "g": 0, "b": 0},      # Red
+        "2": {"r": 0, "g": 255, "b": 0},      # Green
+        "3": {"r": 0, "g": 0, "b": 255},      # Blue
+        "4": {"r": 255, "g": 255, "b": 0},    # Yellow
+        "5": {"r": 255, "g": 0, "b": 255},    # Magenta
+        "6": {"r": 128, "g": 128, "b": 128}   # Gray
+    },
+    "activity_summary": {
+        "monthly_start_date": 1,  # Day of month to start monthly reports
+        "show_percentages": False,
+        "time_format": "hours"  # "auto", "seconds", "minutes", "hours"
+    },
+    "ui_preferences": {
+        "show_notifications": True,
+        "minimize_to_tray": True,
+        "auto_connect": True,
+        # BLE scan window in seconds. Munin advertises every 100-150 ms, so
+        # 2 s covers >12 advertising events (P(miss) < 0.001 even at a 50%
+        # scanner duty cycle) while keeping connect latency low.
+        "scan_timeout": 2.0
+    }
+}
+
+# Process-wide shared instance (see MuninConfig.__new__)
+_INSTANCE = None
+_INSTANCE_LOCK = threading.Lock()
+
 class MuninConfig:
+    __slots__ = ('_initialized', 'config_dir', 'config_file', 'default_config',
+                 '_config', '_last_bytes', '_version', '_mtime_ns',
+                 '_write_timer', '_write_lock', '_pending_edits',
+                 '_face_label_by_int', '_face_color_by_int', '_face_index_version')
+
+    def __new__(cls):
+        """Return the process-wide instance so every subsystem shares one loaded config."""
+        global _INSTANCE
+        with _INSTANCE_LOCK:
+            if _INSTANCE is None:
+                _INSTANCE = super().__new__(cls)
+                _INSTANCE._initialized = False
+            return _INSTANCE
+
     def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
         self.config_dir = Path.home() / ".munin"
         self.config_file = self.config_dir / "config.json"
-        # SINGLE SOURCE OF TRUTH for all default configuration values
-        # Changes here will propagate to new configs and reset operations
-        self.default_config = {
-            "preferred_device_name": None,
-            "preferred_mac_address": None,
-            "face_labels": {
-                "1": "Emails",
-                "2": "Coding", 
-                "3": "Meetings",
-                "4": "Planning",
-                "5": "Break",
-                "6": "Off"
-            },
-            "face_colors": {
-                "1": {"r": 255, "g": 0, "b": 0},      # Red
-                "2": {"r": 0, "g": 255, "b": 0},      # Green
-                "3": {"r": 0, "g": 0, "b": 255},      # Blue
-                "4": {"r": 255, "g": 255, "b": 0},    # Yellow
-                "5": {"r": 255, "g": 0, "b": 255},    # Magenta
-                "6": {"r": 128, "g": 128, "b": 128}   # Gray
-            },
-            "activity_summary": {
-                "monthly_start_date": 1,  # Day of month to start monthly reports
-                "show_percentages": False,
-                "time_format": "hours"  # "auto", "seconds", "minutes", "hours"
-            },
-            "ui_preferences": {
-                "show_notifications": True,
-                "minimize_to_tray": True,
-                "auto_connect": True
-            }
-        }
+        # Read-only view; copies for live use are deep-copied from DEFAULT_CONFIG
+        self.default_config = MappingProxyType(DEFAULT_CONFIG)
         self._config = None
-        self._ensure_config_exists()
-    
-    def _ensure_config_exists(self):
-        """Create config directory and file if they don't exist"""
-        self.config_dir.mkdir(exist_ok=True)
-        if not self.config_file.exists():
-            logger.log_event("Creating default config file")
-            self.save_config(self.default_config)
+        self._last_bytes = None  # serialized form of what is on disk, to skip no-op saves
+        self._version = 0  # bumped whenever the in-memory config is (re)loaded or changed
+        self._mtime_ns = None  # config file mtime at last load/save, for reload_if_changed
+        # Setter writes are coalesced on a short timer; pending changes are flushed at exit
+        self._write_timer = None  # type: Optional[threading.Timer]
+        # Guards the live dict, the version counters and file writes (setters, timer thread, atexit)
+        self._write_lock = threading.RLock()
+        # Setter edits not yet written, replayed if another process changes the file meanwhile
+        self._pending_edits = []  # type: List[Callable[[Dict[str, Any]], None]]
+        atexit.register(self._flush, durable=True)
+        # int-keyed views of face_labels / face_colors, rebuilt when _version moves
+        self._face_label_by_int = {}  # type: Dict[int, str]
+        self._face_color_by_int = {}  # type: Dict[int, Dict[str, int]]
+        self._face_index_version = -1
+        self.load_config()
     
     def load_config(self) -> Dict[str, Any]:
-        """Load configuration from file"""
+        """Load configuration from file, creating it from defaults on first run
+
+        The read itself doubles as the existence check; the directory and file
+        are only created when it raises FileNotFoundError.
+        """
         if self._config is None:
             try:
-                with open(self.config_file, 'r') as f:
-                    self._config = json.load(f)
-                logger.log_event("Configuration loaded", "debug")
+                try:
+                    data = self.config_file.read_bytes()
+                except FileNotFoundError:
+                    logger.log_event("Creating default config file")
+                    # save_config creates the directory and adopts the dict as _config
+                    self.save_config(copy.deepcopy(DEFAULT_CONFIG))
+                    if self._config is not None:
+                        return self._config
+                    raise
+                self._config = _loads(data)
+                self._last_bytes = data
+                self._mtime_ns = self._stat_mtime_ns()
+                self._version += 1
+                logger.log_event("Configuration loaded", level="debug")
                 
                 # Ensure all default face labels are present
                 self._ensure_all_face_labels()
                 
             except (FileNotFoundError, json.JSONDecodeError) as e:
-                logger.log_event(f"Error loading config: {e}, using defaults")
-                self._config = self.default_config.copy()
+                logger.log_event("Error loading config: %s, using defaults", e)
+                # Deep copy so edits never leak into the shared defaults
+                self._config = copy.deepcopy(DEFAULT_CONFIG)
+                self._version += 1
         return self._config
     
+    def _stat_mtime_ns(self) -> Optional[int]:
+        """Return the config file mtime in ns, or None if it cannot be stat'ed"""
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return None
+    
+    def reload_if_changed(self) -> bool:
+        """Re-read the config file if its mtime differs from the last load/save.
+
+        Getters only ever read the in-memory config; call this when another
+        process (e.g. the settings editor) may have written the file.
+        Returns True if the config was reloaded.
+        """
+        with self._write_lock:
+            mtime = self._stat_mtime_ns()
+            if mtime is not None and mtime == self._mtime_ns:
+                return False
+            # Local edits still waiting for the timer are replayed on top of the file
+            self._reload_locked()
+            return True
+
+    def _reload_locked(self):
+        """Re-read the file and replay unwritten setter edits (caller holds _write_lock)"""
+        self._config = None
+        self.load_config()
+        if self._pending_edits:
+            for edit in self._pending_edits:
+                edit(self._config)
+            self._version += 1
+    
     def _ensure_all_face_labels(self):
         """Ensure all face labels from default config are present"""
         if "face_labels" not in self._config:
             self._config["face_labels"] = {}
         
         default_face_labels = self.default_config["face_labels"]
-        config_updated = False
-        
-        for face_id, default_label in default_face_labels.items():
-            if face_id not in self._config["face_labels"]:
-                self._config["face_labels"][face_id] = default_label
-                config_updated = True
+        face_labels = self._config["face_labels"]
+        missing_labels = default_face_labels.keys() - face_labels.keys()
+        for face_id in missing_labels:
+            face_labels[face_id] = default_face_labels[face_id]
         
         # Also ensure face colors are present
         if "face_colors" not in self._config:
             self._config["face_colors"] = {}
         
         default_face_colors = self.default_config["face_colors"]
-        for face_id, default_color in default_face_colors.items():
-            if face_id not in self._config["face_colors"]:
-                self._config["face_colors"][face_id] = default_color
-                config_updated = True
+        face_colors = self._config["face_colors"]
+        missing_colors = default_face_colors.keys() - face_colors.keys()
+        for face_id in missing_colors:
+            # Copy so later edits never touch the shared defaults
+            face_colors[face_id] = dict(default_face_colors[face_id])
+        
+        config_updated = bool(missing_labels or missing_colors)
         
         # Save updated config if any labels or colors were added
         if config_updated:
             self.save_config(self._config)
             logger.log_event("Updated config with missing face labels/colors")
     
-    def save_config(self, config: Dict[str, Any]):
+    def save_config(self, config: Dict[str, Any], durable: bool = False):
         """Save configuration atomically (never append / partial write).
 
         Strategy:
         1. Serialize JSON to a temp file in the same directory.
-        2. Flush + fsync to ensure bytes hit disk.
+        2. With durable=True, flush + fsync so the bytes hit disk first.
         3. os.replace() to atomically swap into place.
-        This prevents duplicated JSON fragments or truncated files if the
-        process crashes mid-write.
+        os.replace alone already prevents duplicated JSON fragments or
+        truncated files if the process crashes mid-write; the fsync barrier
+        is only paid on the final flush at exit. If the serialized bytes
+        match what is already on disk the write is skipped.
+        Serializing and writing happen under _write_lock, so the bytes are a
+        consistent snapshot and concurrent writers cannot reorder saves.
         """
-        try:
-            self.config_dir.mkdir(exist_ok=True)
-            # Serialize first
-            data = json.dumps(config, indent=2)
-            # Write to temp file in same directory for atomic replace
-            with tempfile.NamedTemporaryFile('w', dir=self.config_dir, delete=False, prefix='config.', suffix='.tmp') as tmp:
-                tmp.write(data)
-                tmp.flush()
-                os.fsync(tmp.fileno())
-                temp_path = Path(tmp.name)
-            # Atomic replace
-            os.replace(temp_path, self.config_file)
-            self._config = config
-            logger.log_event("Configuration saved (atomic)")
-        except Exception as e:
-            logger.log_event(f"Error saving config atomically: {e}")
-            # Best effort cleanup: remove temp if it still exists
+        with self._write_lock:
             try:
-                if 'temp_path' in locals() and temp_path.exists():
-                    temp_path.unlink()
-            except Exception:
-                pass
+                # Serialize first
+                data = _dumps(config)
+                if data == self._last_bytes:
+                    self._config = config
+                    return
+                # Content changed; bump even if the write below fails, since
+                # callers have already mutated the in-memory dict
+                self._version += 1
+                self.config_dir.mkdir(exist_ok=True)
+                # Temp name is unique per process and thread so concurrent writers
+                # (timer flush, BLE thread, settings editor) never share a file
+                temp_path = self.config_file.with_name(f"config.{os.getpid()}.{threading.get_ident()}.tmp")
+                fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+                try:
+                    try:
+                        view = memoryview(data)
+                        while view:
+                            view = view[os.write(fd, view):]
+                        if durable:
+                            try:
+                                os.fsync(fd)
+                            except OSError as e:
+                                # Some network filesystems (SMB/NFS) reject fsync; the replace is still atomic
+                                logger.log_event("fsync not supported for config file: %s", e, level="debug")
+                    finally:
+                        os.close(fd)
+                    # Atomic replace
+                    os.replace(temp_path, self.config_file)
+                except BaseException:
+                    try:
+                        os.unlink(temp_path)
+                    except OSError:
+                        pass
+                    raise
+                self._config = config
+                self._last_bytes = data
+                self._mtime_ns = self._stat_mtime_ns()
+                logger.log_event("Configuration saved (atomic)")
+            except Exception as e:
+                logger.log_event("Error saving config atomically: %s", e)
+                # Best effort cleanup: remove temp if it still exists
+                try:
+                    if 'temp_path' in locals():
+                        os.unlink(temp_path)
+                except OSError:
+                    pass
+    
+    def _schedule_save(self, delay: float = 0.5):
+        """Save the in-memory config once no further change arrives for `delay` seconds"""
+        with self._write_lock:
+            self._version += 1
+            if self._write_timer is not None:
+                self._write_timer.cancel()
+            timer = threading.Timer(delay, self._flush)
+            timer.daemon = True  # the atexit hook performs the final write
+            self._write_timer = timer
+        timer.start()
+    
+    def _flush(self, durable: bool = False):
+        """Write pending setter changes now (timer callback and atexit hook)"""
+        with self._write_lock:
+            timer, self._write_timer = self._write_timer, None
+            if timer is None:
+                return
+            timer.cancel()
+            if self._stat_mtime_ns() != self._mtime_ns:
+                # Another process wrote the file since we last read it; merge instead of clobbering
+                self._reload_locked()
+            if self._config is not None:
+                self.save_config(self._config, durable=durable)
+            self._pending_edits.clear()
+
+    def _edit(self, edit: Callable[[Dict[str, Any]], None]):
+        """Apply edit to the live config and schedule a debounced save"""
+        with self._write_lock:
+            edit(self._config if self._config is not None else self.load_config())
+            self._pending_edits.append(edit)
+            self._schedule_save()
+    
+    # Direct views of the live config sections. face_labels/face_colors are
+    # always present after load (_ensure_all_face_labels fills them in).
+    @property
+    def face_labels(self) -> Dict[str, str]:
+        config = self._config if self._config is not None else self.load_config()
+        return config["face_labels"]
+    
+    @property
+    def face_colors(self) -> Dict[str, Dict[str, int]]:
+        config = self._config if self._config is not None else self.load_config()
+        return config["face_colors"]
+    
+    @property
+    def activity_summary_config(self) -> Dict[str, Any]:
+        config = self._config if self._config is not None else self.load_config()
+        section = config.get("activity_summary")
+        # Copy: default_config's proxy is read-only only at the top level
+        return section if section is not None else dict(self.default_config["activity_summary"])
+    
+    @property
+    def ui_preferences(self) -> Dict[str, Any]:
+        config = self._config if self._config is not None else self.load_config()
+        section = config.get("ui_preferences")
+        # Copy: default_config's proxy is read-only only at the top level
+        return section if section is not None else dict(self.default_config["ui_preferences"])
     
     def get_preferred_device(self) -> tuple[Optional[str], Optional[str]]:
         """Get preferred device name and MAC address"""
-        config = self.load_config()
+        config = self._config if self._config is not None else self.load_config()
         return config.get("preferred_device_name"), config.get("preferred_mac_address")
     
     def set_preferred_device(self, device_name: str, mac_address: str):
         """Set preferred device name and MAC address"""
-        config = self.load_config()
-        config["preferred_device_name"] = device_name
-        config["preferred_mac_address"] = mac_address
-        self.save_config(config)
-        logger.log_event(f"Set preferred device: {device_name} ({mac_address})")
+        def edit(config):
+            config["preferred_device_name"] = device_name
+            config["preferred_mac_address"] = mac_address
+        self._edit(edit)
+        logger.log_event("Set preferred device: %s (%s)", device_name, mac_address)
     
     def get_face_labels(self) -> Dict[str, str]:
         """Get face labels configuration"""
-        config = self.load_config()
-        return config.get("face_labels", self.default_config["face_labels"])
+        return self.face_labels
     
     def set_face_label(self, face_number: str, label: str):
         """Set label for a specific face"""
-        config = self.load_config()
-        if "face_labels" not in config:
-            config["face_labels"] = {}
-        config["face_labels"][face_number] = label
-        self.save_config(config)
-        logger.log_event(f"Set face {face_number} label to: {label}")
+        def edit(config):
+            if "face_labels" not in config:
+                config["face_labels"] = {}
+            config["face_labels"][face_number] = label
+        self._edit(edit)
+        logger.log_event("Set face %s label to: %s", face_number, label)
+    
+    def _face_index(self):
+        """Rebuild the int-keyed face label/color lookups if the config changed"""
+        if self._face_index_version != self._version:
+            self._face_label_by_int = {int(k): v for k, v in self.get_face_labels().items()}
+            self._face_color_by_int = {int(k): v for k, v in self.get_face_colors().items()}
+            self._face_index_version = self._version
     
     def get_face_label(self, face_number: int) -> str:
         """Get label for a specific face number"""
-        face_labels = self.get_face_labels()
-        return face_labels.get(str(face_number), f"Face {face_number}")
+        self._face_index()
+        label = self._face_label_by_int.get(face_number)
+        return label if label is not None else "Face " + str(face_number)
     
     def get_face_colors(self) -> Dict[str, Dict[str, int]]:
         """Get face colors configuration"""
-        config = self.load_config()
-        return config.get("face_colors", self.default_config["face_colors"])
+        return self.face_colors
     
     def get_face_color(self, face_number: int) -> Dict[str, int]:
         """Get color for a specific face number."""
-        face_colors = self.get_face_colors()
-        default_color = {"r": 128, "g": 128, "b": 128}
-        return face_colors.get(str(face_number), default_color)
+        self._face_index()
+        color = self._face_color_by_int.get(face_number)
+        return color if color is not None else {"r": 128, "g": 128, "b": 128}
     
     def set_face_color(self, face_number: str, r: int, g: int, b: int):
         """Set color for a specific face."""
-        config = self.load_config()
-        if "face_colors" not in config:
-            config["face_colors"] = {}
-        config["face_colors"][face_number] = {"r": r, "g": g, "b": b}
-        self.save_config(config)
-        logger.log_event(f"Set face {face_number} color to: RGB({r},{g},{b})")
+        def edit(config):
+            if "face_colors" not in config:
+                config["face_colors"] = {}
+            config["face_colors"][face_number] = {"r": r, "g": g, "b": b}
+        self._edit(edit)
+        logger.log_event("Set face %s color to: RGB(%s,%s,%s)", face_number, r, g, b)
     
     def get_activity_summary_config(self) -> Dict[str, Any]:
         """Get activity summary configuration"""
-        config = self.load_config()
-        return config.get("activity_summary", self.default_config["activity_summary"])
+        return self.activity_summary_config
     
     def set_activity_summary_config(self, **kwargs):
         """Update activity summary configuration"""
-        config = self.load_config()
-        if "activity_summary" not in config:
-            config["activity_summary"] = self.default_config["activity_summary"].copy()
-        
-        for key, value in kwargs.items():
-            if key in self.default_config["activity_summary"]:
-                config["activity_summary"][key] = value
-        
-        self.save_config(config)
-        logger.log_event(f"Updated activity summary config: {kwargs}")
+        def edit(config):
+            if "activity_summary" not in config:
+                config["activity_summary"] = self.default_config["activity_summary"].copy()
+            for key, value in kwargs.items():
+                if key in self.default_config["activity_summary"]:
+                    config["activity_summary"][key] = value
+        self._edit(edit)
+        logger.log_event("Updated activity summary config: %s", kwargs)
     
     def get_monthly_start_date(self) -> int:
         """Get the day of month when monthly reports should start"""
@@ -213,5 +410,9 @@ class MuninConfig:
     
     def get_ui_preferences(self) -> Dict[str, Any]:
         """Get UI preferences"""
-        config = self.load_config()
-        return config.get("ui_preferences", self.default_config["ui_preferences"])
+        return self.ui_preferences
+    
+    def get_scan_timeout(self) -> float:
+        """Get BLE scan window in seconds"""
+        ui_preferences = self.get_ui_preferences()
+        return float(ui_preferences.get("scan_timeout", self.default_config["ui_preferences"]["scan_timeout"]))
@@ -6,41 +6,53 @@ handling the custom Munin protocol as defined in PROTOCOL.md.
 """
 
 import asyncio
+import random
 import struct
-from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple, Dict, Any
+import time
+from collections import deque
+from typing import Optional, List, Tuple, Any, Union
 from dataclasses import dataclass
 from datetime import datetime
+from munin_client.config import MuninConfig
 from munin_client.logger import MuninLogger
 from munin_client.time_tracker import TimeTracker
 
 logger = MuninLogger()
 
-@dataclass
+# Precompiled packet codecs (see PROTOCOL.md)
+_LOG_STRUCT = struct.Struct('<BIB')    # event_type, delta_s, face_id
+_FACE_STRUCT = struct.Struct('<BBBB')  # face_id, r, g, b
+
+@dataclass(slots=True, frozen=True)
 class MuninLogEntry:
     """Represents a Munin time tracking log entry"""
     event_type: int
     delta_s: int
     face_id: int
-    timestamp: datetime
+    timestamp_ns: int  # arrival time, time.time_ns()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Arrival time as a datetime (built on demand)"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
     
     @classmethod
-    def from_packet(cls, packet_data: bytes, arrival_time: datetime) -> 'MuninLogEntry':
+    def from_packet(cls, packet_data: Union[bytes, bytearray, memoryview], arrival_time_ns: int) -> 'MuninLogEntry':
         """Parse a 6-byte Munin log packet"""
-        if len(packet_data) != 6:
-            raise ValueError(f"Invalid packet length: {len(packet_data)} (expected 6)")
+        if len(packet_data) != _LOG_STRUCT.size:
+            raise ValueError(f"Invalid packet length: {len(packet_data)} (expected {_LOG_STRUCT.size})")
         
         # Unpack the 6-byte packet: uint8, uint32 (little-endian), uint8
-        event_type, delta_s, face_id = struct.unpack('<BIB', packet_data)
+        event_type, delta_s, face_id = _LOG_STRUCT.unpack_from(packet_data, 0)
         
         return cls(
             event_type=event_type,
             delta_s=delta_s,
             face_id=face_id,
-            timestamp=arrival_time
+            timestamp_ns=arrival_time_ns
         )
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FaceConfig:
     """Face color configuration."""
     face_id: int
@@ -50,10 +62,38 @@ class FaceConfig:
 
     def to_packet(self) -> bytes:
         """Return 4-byte packet <face,r,g,b>."""
-        return struct.pack('<BBBB', self.face_id, self.r, self.g, self.b)
+        return _FACE_STRUCT.pack(self.face_id, self.r, self.g, self.b)
+
+    @staticmethod
+    def pack_list(face_configs: List['FaceConfig']) -> bytearray:
+        """Return the concatenated packets for face_configs in one buffer."""
+        size = _FACE_STRUCT.size
+        pack_into = _FACE_STRUCT.pack_into
+        buf = bytearray(size * len(face_configs))
+        for offset, config in zip(range(0, len(buf), size), face_configs):
+            pack_into(buf, offset, config.face_id, config.r, config.g, config.b)
+        return buf
 
-class MuninDevice(ABC):
-    """Abstract base class for Munin devices (real and fake)"""
+class MuninDevice:
+    """Base class for Munin devices (real and fake); subclasses implement the I/O methods"""
+    
+    __slots__ = ('name', 'address', 'battery_level', 'is_connected_flag', 'time_tracker',
+                 'is_reconnecting', 'ble_manager', 'protocol_version', 'config', '_event_handlers')
+    
+    # Munin-specific service UUIDs (matching Arduino code)
+    MUNIN_SERVICE_UUID = "6e400001-8a3a-11e5-8994-feff819cdc9f"
+    MUNIN_LOG_CHAR_UUID = "6e400002-8a3a-11e5-8994-feff819cdc9f"
+    MUNIN_LED_CONFIG_CHAR_UUID = "6e400003-8a3a-11e5-8994-feff819cdc9f"
+    MUNIN_FACE_CHAR_UUID = "6e400004-8a3a-11e5-8994-feff819cdc9f"
+    
+    # Standard BLE Battery Service
+    BATTERY_SERVICE_UUID = "0000180f-0000-1000-8000-00805f9b34fb"
+    BATTERY_LEVEL_CHAR_UUID = "00002a19-0000-1000-8000-00805f9b34fb"
+    BATTERY_LEVEL_STATUS_CHAR_UUID = "00002a1b-0000-1000-8000-00805f9b34fb"
+    
+    # Lowercased forms for comparisons against discovered UUIDs, computed once
+    MUNIN_SERVICE_UUID_LC = MUNIN_SERVICE_UUID.lower()
+    BATTERY_SERVICE_UUID_LC = BATTERY_SERVICE_UUID.lower()
     
     def __init__(self, name: str, address: str, ble_manager=None):
         self.name = name
@@ -65,112 +105,147 @@ class MuninDevice(ABC):
         self.ble_manager = ble_manager  # Reference to BLE manager for callbacks
         # Protocol / feature flags
         self.protocol_version: Optional[Tuple[int,int,int]] = None
-        
-        # Munin-specific service UUIDs (matching Arduino code)
-        self.MUNIN_SERVICE_UUID = "6e400001-8a3a-11e5-8994-feff819cdc9f"
-        self.MUNIN_LOG_CHAR_UUID = "6e400002-8a3a-11e5-8994-feff819cdc9f"
-        self.MUNIN_LED_CONFIG_CHAR_UUID = "6e400003-8a3a-11e5-8994-feff819cdc9f"
-        self.MUNIN_FACE_CHAR_UUID = "6e400004-8a3a-11e5-8994-feff819cdc9f"
-        
-        # Standard BLE Battery Service
-        self.BATTERY_SERVICE_UUID = "0000180f-0000-1000-8000-00805f9b34fb"
-        self.BATTERY_LEVEL_CHAR_UUID = "00002a19-0000-1000-8000-00805f9b34fb"
-        self.BATTERY_LEVEL_STATUS_CHAR_UUID = "00002a1b-0000-1000-8000-00805f9b34fb"
+        self.config = MuninConfig()  # shared process-wide instance, for face labels
+        # Log event type -> handler; see PROTOCOL.md for the event codes
+        self._event_handlers = {
+            0x01: self._handle_face_switch,
+            0x03: self._handle_state_sync,
+            0x04: self._handle_battery_status,
+            0x05: self._handle_version,
+            0x10: self._handle_boot,
+            0x11: self._handle_shutdown,
+            0x12: self._handle_low_battery,
+            0x20: self._handle_ble_connect,
+            0x21: self._handle_ble_disconnect,
+        }
     
-    @abstractmethod
     async def connect(self) -> bool:
         """Connect to the device"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     async def disconnect(self):
         """Disconnect from the device"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     async def read_battery_level(self) -> Optional[int]:
         """Read battery level from device"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     async def send_face_config(self, face_configs: List[FaceConfig]) -> bool:
         """Send face color configuration to device"""
-        pass
+        raise NotImplementedError
     
     def is_connected(self) -> bool:
         """Check if device is connected"""
         return self.is_connected_flag
     
+    async def ping(self) -> bool:
+        """Cheap liveness probe; raises if the link is dead"""
+        return self.is_connected()
+    
     def get_device_info(self) -> Tuple[str, str]:
         """Get device name and address"""
         return (self.name, self.address)
     
+    def _face_label(self, face_id: int) -> str:
+        """Configured label for a face (in-memory lookup, no disk access)"""
+        try:
+            return self.config.get_face_label(face_id)
+        except Exception:
+            return f"Face {face_id}"
+    
+    def _handle_face_change(self, face_id: int):
+        """Single path for face changes from any notification source.
+
+        Updates the time tracker and emits the user-facing log line; both
+        suppress repeats of the current face, and the label is only looked
+        up when a line will actually be logged.
+        """
+        self.time_tracker.log_face_change(face_id)
+        if logger.last_face_id != face_id:
+            logger.log_face_change(face_id, self._face_label(face_id))
+    
     def _process_log_entry(self, log_entry: 'MuninLogEntry'):
         """Process a received log entry (shared implementation)"""
-        logger.log_event(f"Processed log entry: type=0x{log_entry.event_type:02x}, face={log_entry.face_id}, delta={log_entry.delta_s}s", "debug")
-        
-        # Handle face switch events for time tracking
-        if log_entry.event_type == 0x01:  # Face switch event (always delta=0 now)
-            self.time_tracker.log_face_change(log_entry.face_id)
-            
-            # Also log to the regular logger for immediate feedback
-            try:
-                from munin_client.config import MuninConfig
-                config = MuninConfig()
-                face_label = config.get_face_label(log_entry.face_id)
-            except Exception:
-                face_label = f"Face {log_entry.face_id}"
-            
-            logger.log_face_change(log_entry.face_id, face_label)
-            
-        elif log_entry.event_type == 0x03:  # State sync event
-            # This is a connection state sync - the device was already on this face
-            logger.log_event(f"Connection state sync: face {log_entry.face_id} active for {log_entry.delta_s}s")
-            # Don't log as a new face change, just update tracking state
-            self.time_tracker.sync_current_face(log_entry.face_id, log_entry.delta_s)
-            
-        elif log_entry.event_type == 0x04:  # Battery status event
-            # Decode battery status from packet
-            voltage_10mv = log_entry.delta_s  # Voltage in 10mV units
-            voltage_mv = voltage_10mv * 10    # Convert to mV
-            percentage = log_entry.face_id & 0x7F  # Lower 7 bits
-            is_charging = bool(log_entry.face_id & 0x80)  # MSB is charging flag
-            
-            logger.log_event(f"Battery status: {voltage_mv}mV, {percentage}%, {'charging' if is_charging else 'discharging'}")
-            if self.ble_manager:
-                self.ble_manager.update_battery_status(voltage_mv, percentage, is_charging)
-            
-        elif log_entry.event_type == 0x10:  # Boot event
-            logger.log_event("Device booted")
-            
-        elif log_entry.event_type == 0x11:  # Shutdown event
-            logger.log_event("Device shutting down")
-            
-        elif log_entry.event_type == 0x12:  # Low battery event
-            logger.log_event(f"LOW BATTERY WARNING - device voltage below safe threshold")
-            
-        elif log_entry.event_type == 0x20:  # BLE connect event
-            logger.log_event("BLE client connected")
-            
-        elif log_entry.event_type == 0x21:  # BLE disconnect event
-            logger.log_event("BLE client disconnected")
+        logger.log_event("Processed log entry: type=0x%02x, face=%d, delta=%ds",
+                         log_entry.event_type, log_entry.face_id, log_entry.delta_s, level="debug")
         
-        elif log_entry.event_type == 0x05:  # Version event
-            # Decode semver from delta_s: (major<<16 | minor<<8 | patch)
-            major = (log_entry.delta_s >> 16) & 0xFF
-            minor = (log_entry.delta_s >> 8) & 0xFF
-            patch = log_entry.delta_s & 0xFF
-            self.protocol_version = (major, minor, patch)
-            logger.log_event(f"Device firmware version: {major}.{minor}.{patch}")
-            
+        handler = self._event_handlers.get(log_entry.event_type)
+        if handler is not None:
+            handler(log_entry)
         # TODO: Handle other event types if needed in the future
+    
+    def _handle_face_switch(self, log_entry: 'MuninLogEntry'):
+        """0x01: face switch (always delta=0 now)"""
+        self._handle_face_change(log_entry.face_id)
+    
+    def _handle_state_sync(self, log_entry: 'MuninLogEntry'):
+        """0x03: connection state sync - the device was already on this face"""
+        logger.log_event("Connection state sync: face %d active for %ds", log_entry.face_id, log_entry.delta_s)
+        # Don't log as a new face change, just update tracking state
+        self.time_tracker.sync_current_face(log_entry.face_id, log_entry.delta_s)
+    
+    def _handle_battery_status(self, log_entry: 'MuninLogEntry'):
+        """0x04: battery status"""
+        # delta_s carries voltage in 10mV units; face_id carries percentage (low 7 bits)
+        # and the charging flag (MSB)
+        status = log_entry.face_id
+        voltage_mv = log_entry.delta_s * 10
+        percentage = status & 0x7F
+        is_charging = status >= 0x80
+        
+        logger.log_event("Battery status: %dmV, %d%%, %s",
+                         voltage_mv, percentage, "charging" if is_charging else "discharging")
+        if self.ble_manager is not None:
+            self.ble_manager.update_battery_status(voltage_mv, percentage, is_charging)
+    
+    def _handle_version(self, log_entry: 'MuninLogEntry'):
+        """0x05: firmware version, semver in delta_s as (major<<16 | minor<<8 | patch)"""
+        major = (log_entry.delta_s >> 16) & 0xFF
+        minor = (log_entry.delta_s >> 8) & 0xFF
+        patch = log_entry.delta_s & 0xFF
+        self.protocol_version = (major, minor, patch)
+        logger.log_event("Device firmware version: %s.%s.%s", major, minor, patch)
+    
+    def _handle_boot(self, log_entry: 'MuninLogEntry'):
+        """0x10: boot"""
+        logger.log_event("Device booted")
+    
+    def _handle_shutdown(self, log_entry: 'MuninLogEntry'):
+        """0x11: shutdown"""
+        logger.log_event("Device shutting down")
+    
+    def _handle_low_battery(self, log_entry: 'MuninLogEntry'):
+        """0x12: low battery"""
+        logger.log_event("LOW BATTERY WARNING - device voltage below safe threshold")
+    
+    def _handle_ble_connect(self, log_entry: 'MuninLogEntry'):
+        """0x20: BLE client connected"""
+        logger.log_event("BLE client connected")
+    
+    def _handle_ble_disconnect(self, log_entry: 'MuninLogEntry'):
+        """0x21: BLE client disconnected"""
+        logger.log_event("BLE client disconnected")
 
 class MuninDeviceImpl(MuninDevice):
     """Concrete BLE Munin device implementation (formerly RealMuninDevice)"""
 
+    __slots__ = ('client', '_batch_led_writes', '_service_uuids', '_ping_char_uuid',
+                 '_notif_queue', '_drain_scheduled')
+
     def __init__(self, name: str, address: str, client, ble_manager=None):
         super().__init__(name, address, ble_manager)
         self.client = client
+        # Cleared if the firmware rejects multi-entry LED config writes
+        self._batch_led_writes = True
+        # Lowercased service UUIDs discovered on connect; GATT layout is fixed per connection
+        self._service_uuids = frozenset()
+        # Readable characteristic used by ping(); None if the device exposes neither candidate
+        self._ping_char_uuid = None
+        # Notifications are queued by the bleak callback and parsed in one batch per loop step.
+        # Unbounded: the drain runs on the next loop step, and dropping entries would lose face events
+        self._notif_queue = deque()
+        self._drain_scheduled = False
 
     async def connect(self) -> bool:
         """Connect to the device"""
@@ -180,18 +255,25 @@ class MuninDeviceImpl(MuninDevice):
 
             if self.client.is_connected:
                 self.is_connected_flag = True
+                services = self.client.services
+                self._service_uuids = frozenset(service.uuid.lower() for service in services)
+                # Face characteristic is optional on older firmware; fall back to battery level
+                self._ping_char_uuid = next(
+                    (uuid for uuid in (self.MUNIN_FACE_CHAR_UUID, self.BATTERY_LEVEL_CHAR_UUID)
+                     if services.get_characteristic(uuid) is not None),
+                    None)
 
                 if self.time_tracker.current_face is not None:
                     self.is_reconnecting = True
-                    logger.log_event(f"Reconnected to Munin device: {self.name}")
+                    logger.log_event("Reconnected to Munin device: %s", self.name)
                 else:
-                    logger.log_event(f"Connected to Munin device: {self.name}")
+                    logger.log_event("Connected to Munin device: %s", self.name)
 
                 await self._setup_log_notifications()
                 return True
             return False
         except Exception as e:
-            logger.log_event(f"Error connecting to device {self.name}: {e}")
+            logger.log_event("Error connecting to device %s: %s", self.name, e)
             return False
 
     async def disconnect(self, is_temporary: bool = False):
@@ -203,9 +285,9 @@ class MuninDeviceImpl(MuninDevice):
             if self.client.is_connected:
                 await self.client.disconnect()
             self.is_connected_flag = False
-            logger.log_event(f"Disconnected from Munin device: {self.name}" + (" (temporary)" if is_temporary else ""))
+            logger.log_event("Disconnected from Munin device: %s%s", self.name, " (temporary)" if is_temporary else "")
         except Exception as e:
-            logger.log_event(f"Error disconnecting from device: {e}")
+            logger.log_event("Error disconnecting from device: %s", e)
 
     async def read_battery_level(self) -> Optional[int]:
         """Read battery level from device"""
@@ -213,162 +295,193 @@ class MuninDeviceImpl(MuninDevice):
             if not self.is_connected():
                 return None
 
-            services = self.client.services
-            for service in services:
-                if service.uuid.lower() == self.BATTERY_SERVICE_UUID.lower():
-                    battery_data = await self.client.read_gatt_char(self.BATTERY_LEVEL_CHAR_UUID)
-                    if battery_data:
-                        self.battery_level = int(battery_data[0])
-                        logger.log_event(f"Read battery level from BLE service: {self.battery_level}%")
-                        try:
-                            status_data = await self.client.read_gatt_char(self.BATTERY_LEVEL_STATUS_CHAR_UUID)
-                            if status_data and len(status_data) >= 1:
-                                charge_state = status_data[0] & 0x03
-                                is_charging = (charge_state == 1)
-                                self.ble_manager.update_charging_status(is_charging)
-                                logger.log_event(f"Read charging status: {'charging' if is_charging else 'not charging'}")
-                        except Exception:
-                            pass
-                        return self.battery_level
+            if self.BATTERY_SERVICE_UUID_LC not in self._service_uuids:
+                return None
+            # Level and status are independent reads; issue both together
+            battery_data, status_data = await asyncio.gather(
+                self.client.read_gatt_char(self.BATTERY_LEVEL_CHAR_UUID),
+                self.client.read_gatt_char(self.BATTERY_LEVEL_STATUS_CHAR_UUID),
+                return_exceptions=True,
+            )
+            if isinstance(battery_data, BaseException):
+                raise battery_data
+            if battery_data:
+                self.battery_level = int(battery_data[0])
+                logger.log_event("Read battery level from BLE service: %d%%", self.battery_level)
+                # Status characteristic is optional (older firmware); ignore read failures
+                if not isinstance(status_data, BaseException):
+                    try:
+                        if status_data and len(status_data) >= 1:
+                            charge_state = status_data[0] & 0x03
+                            is_charging = (charge_state == 1)
+                            self.ble_manager.update_charging_status(is_charging)
+                            logger.log_event("Read charging status: %s", "charging" if is_charging else "not charging")
+                    except Exception:
+                        pass
+                return self.battery_level
             return None
         except Exception as e:
-            logger.log_event(f"Error reading battery: {e}")
+            logger.log_event("Error reading battery: %s", e)
             return None
 
+    async def ping(self) -> bool:
+        """Liveness probe: a single small read of a characteristic known to exist.
+
+        Devices exposing neither the face nor the battery level characteristic
+        fall back to the client's connection state.
+        """
+        if self._ping_char_uuid is None:
+            return self.client.is_connected
+        await self.client.read_gatt_char(self._ping_char_uuid)
+        return True
+
     async def send_face_config(self, face_configs: List[FaceConfig]) -> bool:
-        """Send face configuration to device."""
+        """Send face configuration to device.
+
+        Face entries are concatenated and written in as few GATT writes as the
+        ATT MTU allows. Firmware that only accepts single 4-byte writes rejects
+        the batched write; we then fall back to one write per face for the
+        rest of the connection.
+        """
         try:
             if not self.is_connected():
                 return False
+            if self._batch_led_writes:
+                try:
+                    # Whole 4-byte entries that fit in one ATT write (MTU minus 3-byte header)
+                    per_write = max(1, (self.client.mtu_size - 3) // 4)
+                    for i in range(0, len(face_configs), per_write):
+                        payload = FaceConfig.pack_list(face_configs[i:i + per_write])
+                        logger.log_event("Writing LED packet: faces=%d bytes=%s", len(payload) // 4, payload.hex())
+                        # Use write with response to match firmware characteristic (WRITE only)
+                        await self.client.write_gatt_char(self.MUNIN_LED_CONFIG_CHAR_UUID, payload, response=True)
+                    return True
+                except Exception as e:
+                    if not self.client.is_connected:
+                        raise
+                    logger.log_event("Batched LED write rejected (%s); using per-face writes", e)
+                    self._batch_led_writes = False
             for config in face_configs:
                 packet = config.to_packet()
                 # Log exact bytes for troubleshooting
-                try:
-                    logger.log_event(
-                        f"Writing LED packet: face={config.face_id} bytes={packet.hex()}")
-                except Exception:
-                    pass
-                # Use write with response to match firmware characteristic (WRITE only)
+                logger.log_event("Writing LED packet: face=%d bytes=%s", config.face_id, packet.hex())
                 await self.client.write_gatt_char(self.MUNIN_LED_CONFIG_CHAR_UUID, packet, response=True)
                 # Optional small pacing to keep stacks happy
                 await asyncio.sleep(0.01)
             return True
         except Exception as e:
-            logger.log_event(f"Error sending face config: {e}")
+            logger.log_event("Error sending face config: %s", e)
             return False
 
     async def _setup_log_notifications(self):
         """Setup notifications for log and face changes"""
         try:
-            services = self.client.services
-            for service in services:
-                if service.uuid.lower() == self.MUNIN_SERVICE_UUID.lower():
-                    await self.client.start_notify(self.MUNIN_LOG_CHAR_UUID, self._log_notification_handler)
-                    logger.log_event("Enabled log notifications")
-                    try:
-                        await self.client.start_notify(self.MUNIN_FACE_CHAR_UUID, self._face_notification_handler)
-                        logger.log_event("Enabled face notifications")
-                        current_face_data = await self.client.read_gatt_char(self.MUNIN_FACE_CHAR_UUID)
-                        if current_face_data and len(current_face_data) > 0:
-                            current_face = int(current_face_data[0])
-                            logger.log_event(f"Read current face on connect: {current_face}")
-                            if not self.is_reconnecting:
-                                self.time_tracker.log_face_change(current_face)
-                            else:
-                                self.time_tracker.resume_session_if_same_face(current_face)
-                                self.is_reconnecting = False
-                    except Exception as e:
-                        logger.log_event(f"Could not setup face notifications (older firmware?): {e}")
-                    return
-            logger.log_event("Device missing Munin service")
+            if self.MUNIN_SERVICE_UUID_LC not in self._service_uuids:
+                logger.log_event("Device missing Munin service")
+                return
+            await self.client.start_notify(self.MUNIN_LOG_CHAR_UUID, self._log_notification_handler)
+            logger.log_event("Enabled log notifications")
+            try:
+                await self.client.start_notify(self.MUNIN_FACE_CHAR_UUID, self._face_notification_handler)
+                logger.log_event("Enabled face notifications")
+                current_face_data = await self.client.read_gatt_char(self.MUNIN_FACE_CHAR_UUID)
+                if current_face_data and len(current_face_data) > 0:
+                    current_face = int(current_face_data[0])
+                    logger.log_event("Read current face on connect: %s", current_face)
+                    if not self.is_reconnecting:
+                        self.time_tracker.log_face_change(current_face)
+                    else:
+                        self.time_tracker.resume_session_if_same_face(current_face)
+                        self.is_reconnecting = False
+            except Exception as e:
+                logger.log_event("Could not setup face notifications (older firmware?): %s", e)
         except Exception as e:
-            logger.log_event(f"Error setting up notifications: {e}")
+            logger.log_event("Error setting up notifications: %s", e)
     
     def _face_notification_handler(self, sender, data: bytearray):
         """Handle incoming face change notifications"""
+        # Log packets that arrived earlier must reach the time tracker first
+        if self._notif_queue:
+            self._drain_notifications()
         try:
             if len(data) == 1:
                 face_id = int(data[0])
-                logger.log_event(f"Received face notification: face {face_id}", "debug")
-                
-                # Process face change
-                self.time_tracker.log_face_change(face_id)
+                logger.log_event("Received face notification: face %d", face_id, level="debug")
                 
-                # Also log to regular logger
-                try:
-                    from munin_client.config import MuninConfig
-                    config = MuninConfig()
-                    face_label = config.get_face_label(face_id)
-                except Exception:
-                    face_label = f"Face {face_id}"
-                
-                logger.log_face_change(face_id, face_label)
+                self._handle_face_change(face_id)
             else:
-                logger.log_event(f"Received invalid face notification: {len(data)} bytes", "debug")
+                logger.log_event("Received invalid face notification: %d bytes", len(data), level="debug")
                 
         except Exception as e:
-            logger.log_event(f"Error parsing face notification: {e}")
+            logger.log_event("Error parsing face notification: %s", e)
     
     def _log_notification_handler(self, sender, data: bytearray):
-        """Handle incoming log notifications"""
+        """Queue incoming log notifications; parsing is deferred to _drain_notifications"""
+        # bleak invokes this on the event loop thread (so the flag needs no lock) and
+        # hands every notification a fresh bytearray, so it is queued without a copy
+        self._notif_queue.append((data, time.time_ns()))
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            asyncio.get_running_loop().call_soon(self._drain_notifications)
+
+    def _drain_notifications(self):
+        """Process every queued notification in arrival order"""
+        self._drain_scheduled = False
+        queue = self._notif_queue
+        while queue:
+            data, arrival_time_ns = queue.popleft()
+            self._handle_log_notification(data, arrival_time_ns)
+
+    def _handle_log_notification(self, data: bytearray, arrival_time_ns: int):
+        """Handle a single log notification"""
         try:
-            logger.log_event(f"Received BLE notification: {len(data)} bytes: {data.hex()}", "debug")
+            if logger.is_debug_enabled():
+                # Guarded: the hex dump itself would be built even with deferred formatting
+                logger.log_event("Received BLE notification: %d bytes: %s", len(data), data.hex(), level="debug")
             
             if len(data) == 6:  # Valid Munin log packet (now 6 bytes without session)
-                log_entry = MuninLogEntry.from_packet(bytes(data), datetime.now())
+                log_entry = MuninLogEntry.from_packet(data, arrival_time_ns)
                 
                 # Process log entry immediately - no caching needed
                 self._process_log_entry(log_entry)
                 
             elif len(data) == 1:  # Simple face change (from Arduino)
                 face_id = int(data[0])
-                logger.log_event(f"Received face change notification: face {face_id}", "debug")
+                logger.log_event("Received face change notification: face %d", face_id, level="debug")
                 
                 # Check if this is a reconnection scenario
-                was_reconnecting = self.is_reconnecting
                 if self.is_reconnecting:
-                    # This is the first notification after reconnection
+                    # This is the first notification after reconnection; don't log it as a change
                     self.time_tracker.resume_session_if_same_face(face_id)
                     self.is_reconnecting = False
-                    logger.log_event(f"Resumed session after reconnection: face {face_id}", "debug")
+                    logger.log_event("Resumed session after reconnection: face %d", face_id, level="debug")
                 else:
-                    # Normal face change; suppress if duplicate
-                    if self.time_tracker.current_face != face_id:
-                        self.time_tracker.log_face_change(face_id)
-                
-                # Also log to regular logger
-                try:
-                    from munin_client.config import MuninConfig
-                    config = MuninConfig()
-                    face_label = config.get_face_label(face_id)
-                except Exception:
-                    face_label = f"Face {face_id}"
-                
-                if not was_reconnecting:  # Don't double-log during reconnection
-                    if self.time_tracker.current_face == face_id and self.time_tracker.current_face_start_time is not None:
-                        # Only log transition if it was actually a change (time_tracker updated)
-                        pass
-                    else:
-                        logger.log_face_change(face_id, face_label)
+                    self._handle_face_change(face_id)
             else:
-                logger.log_event(f"Received unknown notification format: {len(data)} bytes", "debug")
+                logger.log_event("Received unknown notification format: %d bytes", len(data), level="debug")
                 
         except Exception as e:
-            logger.log_event(f"Error parsing log notification: {e}")
+            logger.log_event("Error parsing log notification: %s", e)
 
 class FakeMuninDevice(MuninDevice):
     """Fake Munin device for testing"""
     
+    __slots__ = ('current_face', 'face_configs', 'is_running', '_simulation_task',
+                 'device_uptime_s', 'session_start_time', '_session_start_monotonic',
+                 'is_charging', 'charging_start_time', 'last_battery_check')
+    
     def __init__(self, name: str = "Munin-Test", address: str = "00:11:22:33:44:55", ble_manager=None):
         super().__init__(name, address, ble_manager)
         self.current_face = 1
-        self.face_configs: Dict[int, FaceConfig] = {}
+        # Packed <face,r,g,b> entries indexed by face_id (1-6), like the firmware's LED table
+        self.face_configs = bytearray(_FACE_STRUCT.size * 7)
         self.is_running = False
         self._simulation_task: Optional[asyncio.Task] = None
         
         # Protocol simulation state
         self.device_uptime_s = 0  # Device uptime in seconds
-        self.session_start_time = None  # When current session started
+        self.session_start_time = None  # When current session started (wall clock, for display)
+        self._session_start_monotonic = None  # Same instant on the monotonic clock, for deltas
         
         # Battery and charging simulation
         self.is_charging = False
@@ -384,20 +497,26 @@ class FakeMuninDevice(MuninDevice):
             # Check if this is a reconnection (time tracker has a current session)
             if self.time_tracker.current_face is not None:
                 self.is_reconnecting = True
-                logger.log_event(f"Reconnected to fake Munin device: {self.name}")
+                logger.log_event("Reconnected to fake Munin device: %s", self.name)
             else:
-                logger.log_event(f"Connected to fake Munin device: {self.name}")
+                logger.log_event("Connected to fake Munin device: %s", self.name)
             
             # Start simulation
             if not self.is_running:
                 self.is_running = True
-                self._simulation_task = asyncio.create_task(self._simulate_device())
+                coro = self._simulate_device()
+                if hasattr(asyncio, "eager_task_factory"):
+                    # Python 3.12+: run the boot/face packets synchronously up to the
+                    # first sleep; only this task is eager, the loop's factory is untouched
+                    self._simulation_task = asyncio.eager_task_factory(asyncio.get_running_loop(), coro)
+                else:
+                    self._simulation_task = asyncio.create_task(coro)
             else:
-                logger.log_event(f"Fake device {self.name} simulation already running")
+                logger.log_event("Fake device %s simulation already running", self.name)
             
             return True
         except Exception as e:
-            logger.log_event(f"Error connecting to fake device: {e}")
+            logger.log_event("Error connecting to fake device: %s", e)
             return False
     
     async def disconnect(self, is_temporary: bool = False):
@@ -418,10 +537,10 @@ class FakeMuninDevice(MuninDevice):
                     pass
                 self._simulation_task = None
             
-            logger.log_event(f"Disconnected from fake Munin device: {self.name}" + 
-                           (" (temporary)" if is_temporary else ""))
+            logger.log_event("Disconnected from fake Munin device: %s%s", self.name,
+                             " (temporary)" if is_temporary else "")
         except Exception as e:
-            logger.log_event(f"Error disconnecting from fake device: {e}")
+            logger.log_event("Error disconnecting from fake device: %s", e)
     
     async def read_battery_level(self) -> Optional[int]:
         """Read battery level from fake device"""
@@ -435,8 +554,13 @@ class FakeMuninDevice(MuninDevice):
             return False
         
         for config in face_configs:
-            self.face_configs[config.face_id] = config
-            logger.log_event(f"Fake device received face config for face {config.face_id}: RGB({config.r},{config.g},{config.b})", "debug")
+            if not 1 <= config.face_id <= 6:
+                logger.log_event("Fake device ignored config for unknown face %d", config.face_id, level="debug")
+                continue
+            _FACE_STRUCT.pack_into(self.face_configs, config.face_id * _FACE_STRUCT.size,
+                                   config.face_id, config.r, config.g, config.b)
+            logger.log_event("Fake device received face config for face %d: RGB(%d,%d,%d)",
+                             config.face_id, config.r, config.g, config.b, level="debug")
         
         return True
     
@@ -444,63 +568,73 @@ class FakeMuninDevice(MuninDevice):
         """Generate and process a 6-byte Munin protocol packet internally"""
         try:
             # Create 6-byte packet: event_type, delta_s (little-endian), face_id
-            packet = struct.pack('<BIB', event_type, delta_s, self.current_face)
+            packet = _LOG_STRUCT.pack(event_type, delta_s, self.current_face)
             
             # Process packet internally (same as real device would via BLE notification)
-            log_entry = MuninLogEntry.from_packet(packet, datetime.now())
+            log_entry = MuninLogEntry.from_packet(packet, time.time_ns())
             self._process_log_entry(log_entry)
             
-            logger.log_event(f"Fake device sent packet: type=0x{event_type:02x}, delta={delta_s}, face={self.current_face}", "debug")
+            logger.log_event("Fake device sent packet: type=0x%02x, delta=%d, face=%d",
+                             event_type, delta_s, self.current_face, level="debug")
         except Exception as e:
-            logger.log_event(f"Error sending fake protocol packet: {e}")
+            logger.log_event("Error sending fake protocol packet: %s", e)
     
     def _get_session_delta_s(self) -> int:
         """Get seconds since current session started"""
-        if not self.session_start_time:
+        if self._session_start_monotonic is None:
             return 0
-        
-        from datetime import datetime
-        delta = datetime.now() - self.session_start_time
-        return int(delta.total_seconds())
+        return int(time.monotonic() - self._session_start_monotonic)
     
     async def _simulate_device(self):
         """Simulate device behavior with real Munin protocol"""
-        import random
-        from datetime import datetime
-        
-        logger.log_event(f"Started fake Munin device simulation: {self.name}")
+        logger.log_event("Started fake Munin device simulation: %s", self.name)
         
         # Send BOOT event (0x10) to start simulation
         self.device_uptime_s = 0
         self.session_start_time = datetime.now()
-        self.last_battery_check = datetime.now()
+        self._session_start_monotonic = time.monotonic()
+        self.last_battery_check = self.session_start_time
         self._send_protocol_packet(0x10, 0)  # Boot event
         
         # Send initial face switch event (0x01)
         self._send_protocol_packet(0x01, 0)  # Face switch with delta_s = 0
         
-        last_ongoing_log = datetime.now()
         ongoing_log_interval = 10.0  # Send ongoing log every 10 seconds
+        battery_interval = 5.0  # Battery simulation step
+        # Random events are drawn as exponential waits with the same average rate
+        # the old 2 s polling loop had, so the loop only wakes when something happens
+        charge_rate = 0.05 / 2  # ~5% chance per 2 s
+        face_rate = 0.1 / 2  # ~10% chance per 2 s (frequent for testing)
+        
+        start = time.monotonic()
+        next_ongoing = start + ongoing_log_interval
+        next_battery = start + battery_interval
+        next_charge = start + random.expovariate(charge_rate)
+        next_face = start + random.expovariate(face_rate)
         
         while self.is_running and self.is_connected():
             try:
-                current_time = datetime.now()
+                wake = min(next_ongoing, next_battery, next_charge, next_face)
+                await asyncio.sleep(max(0.0, wake - time.monotonic()))
+                if not (self.is_running and self.is_connected()):
+                    break
+                now = time.monotonic()
                 
                 # Update device uptime
-                self.device_uptime_s += 2  # 2 seconds per cycle
+                self.device_uptime_s = int(now - start)
                 
                 # Send ongoing log entries periodically (0x02)
-                if (current_time - last_ongoing_log).total_seconds() >= ongoing_log_interval:
+                if now >= next_ongoing:
                     delta_s = self._get_session_delta_s()
                     self._send_protocol_packet(0x02, delta_s)  # Ongoing log
-                    last_ongoing_log = current_time
+                    next_ongoing = now + ongoing_log_interval
                 
                 # Simulate charging status changes
-                if random.random() < 0.05:  # 5% chance per cycle to change charging status
+                if now >= next_charge:
                     if not self.is_charging:
                         # Start charging
                         self.is_charging = True
-                        self.charging_start_time = current_time
+                        self.charging_start_time = datetime.now()
                         logger.log_event("Fake device: Charging simulation started")
                     elif random.random() < 0.3:  # 30% chance to stop charging if already charging
                         # Stop charging
@@ -512,9 +646,10 @@ class FakeMuninDevice(MuninDevice):
                             logger.log_event("Fake device: Fully charged simulation")
                         else:
                             logger.log_event("Fake device: Charging stopped simulation")
+                    next_charge = now + random.expovariate(charge_rate)
                 
                 # Simulate battery changes based on charging status
-                if (current_time - self.last_battery_check).total_seconds() >= 5.0:  # Check every 5 seconds
+                if now >= next_battery:
                     old_battery = self.battery_level
                     
                     if self.is_charging:
@@ -531,27 +666,28 @@ class FakeMuninDevice(MuninDevice):
                         self._send_protocol_packet(0x12, self.device_uptime_s)  # Low battery
                         logger.log_event("Fake device: Low battery warning")
                     
-                    self.last_battery_check = current_time
+                    self.last_battery_check = datetime.now()
+                    next_battery = now + battery_interval
                 
                 # Simulate face changes
-                if random.random() < 0.1:  # 10% chance per cycle (more frequent for testing)
+                if now >= next_face:
                     old_face = self.current_face
                     self.current_face = random.randint(1, 6)
                     if old_face != self.current_face:
                         # Face changed - start new session time tracking
                         self.session_start_time = datetime.now()
+                        self._session_start_monotonic = now
                         
                         # Send face switch event
                         self._send_protocol_packet(0x01, 0)  # Face switch with delta_s = 0
                         
-                        logger.log_event(f"Fake device face changed from {old_face} to {self.current_face}")
-                
-                await asyncio.sleep(2)  # Check every 2 seconds
+                        logger.log_event("Fake device face changed from %d to %d", old_face, self.current_face)
+                    next_face = now + random.expovariate(face_rate)
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.log_event(f"Error in fake device simulation: {e}")
+                logger.log_event("Error in fake device simulation: %s", e)
                 break
         
         # Send shutdown event before stopping
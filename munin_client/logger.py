@@ -1,34 +1,68 @@
+import atexit
 import csv
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 
 LOG_DIR = Path.home() / "Munin" / "logs"
-LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 TIME_LOG_PATH = LOG_DIR / "time_log.csv"
 EVENT_LOG_PATH = LOG_DIR / "events.log"
 
-# Configure event logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler(EVENT_LOG_PATH),
-        logging.StreamHandler()
-    ]
-)
+_INSTANCE = None
+_INSTANCE_LOCK = threading.Lock()
+_configured = False
+
+def _configure_logging():
+    """Create the log directory and configure event logging on the first logged message.
+
+    Kept out of import and MuninLogger() so modules that only create a
+    logger (config tooling, the settings editor) touch nothing on disk.
+    """
+    global _configured
+    with _INSTANCE_LOCK:
+        if _configured:
+            return
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s [%(levelname)s] %(message)s",
+            handlers=[
+                logging.FileHandler(EVENT_LOG_PATH),
+                logging.StreamHandler()
+            ]
+        )
+        _configured = True
+
+# Level name -> logging function, resolved once instead of per call
+_LOG_FUNCS = {
+    "debug": logging.debug,
+    "info": logging.info,
+    "warning": logging.warning,
+    "error": logging.error,
+}
 
 class MuninLogger:
+    def __new__(cls):
+        """Return the process-wide instance; every module's logger shares face state and the CSV handle."""
+        global _INSTANCE
+        with _INSTANCE_LOCK:
+            if _INSTANCE is None:
+                _INSTANCE = super().__new__(cls)
+                _INSTANCE._initialized = False
+            return _INSTANCE
+
     def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
         self.last_face_id = None
         self.last_timestamp = None
         self.last_face_label = None  # Label of previous (from) face
-
-        if not TIME_LOG_PATH.exists():
-            with open(TIME_LOG_PATH, mode='w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(["timestamp", "face_id", "face_label", "duration_s"])
+        # Append handle for the time log, opened on first row and kept open
+        self._csv_file = None
+        self._csv_writer = None
 
     def log_face_change(self, face_id: int, face_label: str):
         """Record a face transition and emit a single arrow-style log line.
@@ -40,6 +74,8 @@ class MuninLogger:
         # Suppress redundant events
         if self.last_face_id == face_id:
             return
+        if not _configured:
+            _configure_logging()
 
         now_dt = datetime.utcnow()
         now_iso = now_dt.isoformat()
@@ -51,9 +87,7 @@ class MuninLogger:
             # Compute duration for the face we're leaving
             duration = (now_dt - self.last_timestamp).total_seconds()
             prev_label = self.last_face_label or f"Face {self.last_face_id}"
-            with open(TIME_LOG_PATH, mode='a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([now_iso, self.last_face_id, prev_label, int(duration)])
+            self._time_log_writer().writerow([now_iso, self.last_face_id, prev_label, int(duration)])
             logging.info(f"Face changed: {self.last_face_id} → {face_id} ({face_label})")
 
         # Update state
@@ -61,8 +95,38 @@ class MuninLogger:
         self.last_face_label = face_label
         self.last_timestamp = now_dt
 
+    def _time_log_writer(self):
+        """CSV writer on a long-lived, line-buffered handle so each row is flushed as written"""
+        if self._csv_writer is None:
+            self._csv_file = open(TIME_LOG_PATH, mode='a', newline='', buffering=1)
+            self._csv_writer = csv.writer(self._csv_file)
+            if self._csv_file.tell() == 0:
+                self._csv_writer.writerow(["timestamp", "face_id", "face_label", "duration_s"])
+            atexit.register(self.close)
+        return self._csv_writer
+
+    def close(self):
+        """Close the time log handle; it is reopened on the next row"""
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+
     def log_battery(self, level: int):
+        if not _configured:
+            _configure_logging()
         logging.info(f"Battery: {level}%")
 
-    def log_event(self, msg: str, level: str = "info"):
-        getattr(logging, level.lower())(msg)
+    def is_debug_enabled(self) -> bool:
+        """Return True if debug messages would be emitted (lets callers skip formatting)."""
+        return logging.getLogger().isEnabledFor(logging.DEBUG)
+
+    def log_event(self, msg: str, *args, level: str = "info"):
+        """Log msg at level (keyword-only). With args, msg is a %-format string
+        that logging only formats if the level is enabled."""
+        if not _configured:
+            _configure_logging()
+        log = _LOG_FUNCS.get(level)
+        if log is None:
+            log = getattr(logging, level.lower())
+        log(msg, *args)
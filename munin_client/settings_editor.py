@@ -104,7 +104,7 @@ class SettingsEditor:
             # Auto-save without closing
             self._save_impl(close_window=False, quiet=True)
         except Exception as e:
-            logger.log_event(f"All-to-color picker error: {e}")
+            logger.log_event("All-to-color picker error: %s", e)
 
     def _set_all_red(self):
         """Quick action: set all faces to pure red and save immediately (no prompts)."""
@@ -114,7 +114,7 @@ class SettingsEditor:
             # Auto-save without closing
             self._save_impl(close_window=False, quiet=True)
         except Exception as e:
-            logger.log_event(f"All-red apply error: {e}")
+            logger.log_event("All-red apply error: %s", e)
 
     def _pick_color(self, face: int):
         try:
@@ -123,7 +123,7 @@ class SettingsEditor:
             if hex_color:
                 self.color_vars[face].set(hex_color.upper())
         except Exception as e:
-            logger.log_event(f"Color picker error: {e}")
+            logger.log_event("Color picker error: %s", e)
 
     def _update_swatch(self, face: int):
         """Update the color preview swatch for a face."""
@@ -202,11 +202,11 @@ class SettingsEditor:
         if not quiet:
             if color_updates or label_updates:
                 if color_updates and label_updates:
-                    logger.log_event(f"Updated {label_updates} label(s), {color_updates} color(s)")
+                    logger.log_event("Updated %s label(s), %s color(s)", label_updates, color_updates)
                 elif label_updates:
-                    logger.log_event(f"Updated {label_updates} label(s)")
+                    logger.log_event("Updated %s label(s)", label_updates)
                 else:
-                    logger.log_event(f"Updated {color_updates} color(s)")
+                    logger.log_event("Updated %s color(s)", color_updates)
             else:
                 logger.log_event("No changes detected")
         if close_window:
@@ -223,7 +223,7 @@ def main():
     try:
         SettingsEditor().run()
     except Exception as e:
-        logger.log_event(f"Settings editor crashed: {e}")
+        logger.log_event("Settings editor crashed: %s", e)
         sys.exit(1)
 
 
@@ -27,7 +27,7 @@ class SettingsWindow:
             try:
                 SettingsWindow(ble_manager)
             except Exception as e:
-                logger.log_event(f"Error launching settings window: {e}")
+                logger.log_event("Error launching settings window: %s", e)
         t = threading.Thread(target=_run, daemon=True)
         t.start()
 
@@ -82,7 +82,7 @@ class SettingsWindow:
             if hex_color:
                 self.color_vars[face].set(hex_color.upper())
         except Exception as e:
-            logger.log_event(f"Color picker error: {e}")
+            logger.log_event("Color picker error: %s", e)
 
     def _save(self):
         # Validate and persist colors
@@ -105,14 +105,14 @@ class SettingsWindow:
                 self.config.set_face_color(str(face), r, g, b)
                 updated += 1
         if updated:
-            logger.log_event(f"Updated {updated} face color(s)")
+            logger.log_event("Updated %s face color(s)", updated)
             # Push new colors to device if connected
             try:
                 if self.ble_manager and self.ble_manager.is_connected():
                     self.ble_manager.send_face_colors_to_device()
                     logger.log_event("Sent face color configuration to device (settings window)")
             except Exception as e:
-                logger.log_event(f"Failed to push colors to device: {e}")
+                logger.log_event("Failed to push colors to device: %s", e)
         else:
             logger.log_event("No color changes detected")
         self._on_close()
@@ -41,9 +41,9 @@ class TimeTracker:
                 with open(self.csv_file_path, 'w', newline='') as csvfile:
                     writer = csv.writer(csvfile)
                     writer.writerow(['timestamp', 'face_id', 'face_label', 'duration_s'])
-                logger.log_event(f"Created new time log file: {self.csv_file_path}")
+                logger.log_event("Created new time log file: %s", self.csv_file_path)
             except Exception as e:
-                logger.log_event(f"Error creating CSV file: {e}")
+                logger.log_event("Error creating CSV file: %s", e)
         
         # Determine the current month from existing log entries
         self._update_last_log_month()
@@ -69,7 +69,7 @@ class TimeTracker:
                 else:
                     self.last_log_month = None
         except Exception as e:
-            logger.log_event(f"Error reading last log month: {e}")
+            logger.log_event("Error reading last log month: %s", e)
             self.last_log_month = None
     
     def _check_and_rollover_log(self, entry_timestamp: datetime):
@@ -93,19 +93,19 @@ class TimeTracker:
             
             # Move existing log to archived name
             shutil.move(self.csv_file_path, archive_path)
-            logger.log_event(f"Archived time log to: {archive_filename}")
+            logger.log_event("Archived time log to: %s", archive_filename)
             
             # Create new log file with headers
             with open(self.csv_file_path, 'w', newline='') as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(['timestamp', 'face_id', 'face_label', 'duration_s'])
-            logger.log_event(f"Created new time log file for {current_month}")
+            logger.log_event("Created new time log file for %s", current_month)
             
             # Update tracking
             self.last_log_month = current_month
             
         except Exception as e:
-            logger.log_event(f"Error during log rollover: {e}")
+            logger.log_event("Error during log rollover: %s", e)
             # Continue with existing file if rollover fails
     
     def log_face_change(self, new_face_id: int):
@@ -127,7 +127,7 @@ class TimeTracker:
 
         # Debug only (avoid duplicate visible logs handled by MuninLogger.log_face_change)
         face_label = self.config.get_face_label(new_face_id)
-        logger.log_event(f"Face tracker updated to {new_face_id} ({face_label})", "debug")
+        logger.log_event("Face tracker updated to %d (%s)", new_face_id, face_label, level="debug")
     
     def _write_csv_entry(self, timestamp: datetime, face_id: int, duration_s: float):
         """Write a single CSV entry"""
@@ -146,10 +146,10 @@ class TimeTracker:
                     round(duration_s, 1)
                 ])
             
-            logger.log_event(f"Logged time entry: {face_label} for {duration_s:.1f}s")
+            logger.log_event("Logged time entry: %s for %.1fs", face_label, duration_s)
             
         except Exception as e:
-            logger.log_event(f"Error writing to CSV: {e}")
+            logger.log_event("Error writing to CSV: %s", e)
     
     def finalize_current_session(self, is_temporary: bool = False):
         """Finalize the current session when disconnecting
@@ -165,18 +165,18 @@ class TimeTracker:
             if is_temporary:
                 # Keep tracking state for reconnection, but update start time
                 self.current_face_start_time = current_time
-                logger.log_event(f"Temporarily finalized session for face {self.current_face}", "debug")
+                logger.log_event("Temporarily finalized session for face %d", self.current_face, level="debug")
             else:
                 # Reset tracking completely
                 self.current_face = None
                 self.current_face_start_time = None
-                logger.log_event("Finalized current time tracking session", "debug")
+                logger.log_event("Finalized current time tracking session", level="debug")
     
     def resume_session_if_same_face(self, face_id: int):
         """Resume session if reconnecting to the same face"""
         if self.current_face == face_id and self.current_face_start_time is not None:
             # Continue with the same face, just update start time to now
-            logger.log_event(f"Resumed tracking for face {face_id} after reconnection", "debug")
+            logger.log_event("Resumed tracking for face %d after reconnection", face_id, level="debug")
         else:
             # Different face or no previous session, start fresh
             self.log_face_change(face_id)
@@ -202,7 +202,7 @@ class TimeTracker:
         self.current_face_start_time = actual_start_time
         
         face_label = self.config.get_face_label(face_id)
-        logger.log_event(f"Synced with device: face {face_id} ({face_label}) active for {elapsed_seconds}s")
+        logger.log_event("Synced with device: face %d (%s) active for %ds", face_id, face_label, elapsed_seconds)
     
     def get_csv_file_path(self) -> str:
         """Get the current CSV file path"""
@@ -54,7 +54,7 @@ def copy_to_clipboard(text):
         process.communicate(input=text.encode('utf-8'))
         return True
     except Exception as e:
-        logger.log_event(f"Failed to copy to clipboard: {e}")
+        logger.log_event("Failed to copy to clipboard: %s", e)
         return False
     
 
@@ -68,10 +68,8 @@ async def ble_worker_async():
     reconnect_attempts = 0
     max_reconnect_attempts = 5
     
-    # Initial connection attempt
+    # Initial connection attempt (preferred device first, then auto-discover)
     connected = await ble_manager.connect_to_preferred_device()
-    if not connected:
-        connected = await ble_manager.auto_connect_to_munin()
     
     if not connected:
         logger.log_event("No Munin device found - will keep trying to connect")
@@ -96,8 +94,10 @@ async def ble_worker_async():
                     logger.log_event("Device connected successfully")
                     reconnect_attempts = 0
                     was_connected = True
-                # If there's a pending request to push face colors, do it now on the BLE loop
-                if getattr(ble_manager, '_pending_send_config', False):
+                # If there's a pending request to push face colors, do it on the BLE loop
+                # once requests have been quiet for the debounce window
+                if (getattr(ble_manager, '_pending_send_config', False)
+                        and time.monotonic() - ble_manager._last_request_ts > ble_manager._debounce_s):
                     try:
                         await ble_manager._send_face_configuration()
                     finally:
@@ -130,12 +130,10 @@ async def ble_worker_async():
                 if connection_check_counter >= 5:
                     if reconnect_attempts < max_reconnect_attempts:
                         reconnect_attempts += 1
-                        logger.log_event(f"Reconnection attempt {reconnect_attempts}/{max_reconnect_attempts}")
+                        logger.log_event("Reconnection attempt %s/%s", reconnect_attempts, max_reconnect_attempts)
                         
                         # Try preferred device first, then auto-discover
                         connected = await ble_manager.connect_to_preferred_device()
-                        if not connected:
-                            connected = await ble_manager.auto_connect_to_munin()
                             
                         if connected:
                             logger.log_event("Reconnection successful!")
@@ -144,7 +142,7 @@ async def ble_worker_async():
                             
                     else:
                         # Max attempts reached, wait longer before trying again
-                        logger.log_event(f"Max reconnection attempts reached, waiting 30 seconds...")
+                        logger.log_event("Max reconnection attempts reached, waiting 30 seconds...")
                         await asyncio.sleep(25)  # Additional 25 + 5 below = 30 seconds
                         reconnect_attempts = 0
                     
@@ -153,14 +151,14 @@ async def ble_worker_async():
                 await asyncio.sleep(1)
                 
         except Exception as e:
-            logger.log_event(f"Error in BLE worker: {e}")
+            logger.log_event("Error in BLE worker: %s", e)
             await asyncio.sleep(5)
     
     # Cleanup
     try:
         await ble_manager.disconnect()
     except Exception as e:
-        logger.log_event(f"Error during cleanup: {e}")
+        logger.log_event("Error during cleanup: %s", e)
     
     logger.log_event("BLE worker shutting down")
 
@@ -190,10 +188,10 @@ def start_tray(enable_fake_device: bool = False):
 
     def scan_devices():
         async def do_scan():
-            devices = await ble_manager.scan_for_devices(5.0)
-            logger.log_event(f"Found {len(devices)} devices")
+            devices = await ble_manager.scan_for_devices()
+            logger.log_event("Found %s devices", len(devices))
             for name, addr, rssi in devices:
-                logger.log_event(f"  {name} ({addr}) RSSI: {rssi}")
+                logger.log_event("  %s (%s) RSSI: %s", name, addr, rssi if rssi is not None else 'Unknown')
         
         asyncio.run(do_scan())
     
@@ -218,7 +216,7 @@ def start_tray(enable_fake_device: bool = False):
             logger.log_event("Monthly summary copied to clipboard")
         else:
             logger.log_event("Failed to copy to clipboard - showing in log")
-            logger.log_event(f"Monthly Activity Summary:\n{summary}")
+            logger.log_event("Monthly Activity Summary:\n%s", summary)
 
     def show_settings(*args):
         """Launch external settings editor process (Tk on main thread)."""
@@ -226,7 +224,7 @@ def start_tray(enable_fake_device: bool = False):
             subprocess.Popen([sys.executable, '-m', 'munin_client.settings_editor'])
             logger.log_event("Launched settings editor")
         except Exception as e:
-            logger.log_event(f"Failed to launch settings editor: {e}")
+            logger.log_event("Failed to launch settings editor: %s", e)
 
 
 
@@ -375,8 +373,7 @@ def start_tray(enable_fake_device: bool = False):
                     if os.path.realpath(event_path) == self._target:
                         # Reload and schedule push
                         try:
-                            config._config = None  # force reload
-                            config.load_config()
+                            config.reload_if_changed()
                             logger.log_event("Config reloaded (watchdog change)")
                             if ble_manager.is_connected():
                                 try:
@@ -386,7 +383,7 @@ def start_tray(enable_fake_device: bool = False):
                                 ble_manager.send_face_colors_to_device()
                                 logger.log_event("Scheduled face color configuration push (watchdog)")
                         except Exception as e:
-                            logger.log_event(f"Failed handling config change: {e}")
+                            logger.log_event("Failed handling config change: %s", e)
                 except Exception:
                     pass
 
@@ -412,7 +409,7 @@ def start_tray(enable_fake_device: bool = False):
             observer.start()
             logger.log_event("Watchdog started for config changes")
         except Exception as e:
-            logger.log_event(f"Failed to start watchdog, falling back to polling: {e}")
+            logger.log_event("Failed to start watchdog, falling back to polling: %s", e)
             observer = None
 
     # Schedule periodic menu + config updates
@@ -443,8 +440,7 @@ def start_tray(enable_fake_device: bool = False):
                     elif mtime != last_config_mtime:
                         last_config_mtime = mtime
                         # Reload config
-                        config._config = None  # force reload
-                        config.load_config()
+                        config.reload_if_changed()
                         logger.log_event("Config reloaded (poll)")
                         # Push colors if connected (schedule for BLE worker loop)
                         try:
@@ -456,9 +452,9 @@ def start_tray(enable_fake_device: bool = False):
                                 ble_manager.send_face_colors_to_device()
                                 logger.log_event("Scheduled face color configuration push (poll)")
                         except Exception as e:
-                            logger.log_event(f"Failed sending colors after reload: {e}")
+                            logger.log_event("Failed sending colors after reload: %s", e)
             except Exception as e:
-                logger.log_event(f"Error in menu loop: {e}")
+                logger.log_event("Error in menu loop: %s", e)
             # Tight loop only if watchdog missing; otherwise sleep a bit
             time.sleep(0.5 if not HAS_WATCHDOG else 1.0)
     
@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from munin_client import config as config_module
+from munin_client.config import MuninConfig
+
+
+class DefaultSectionTests(unittest.TestCase):
+    def setUp(self):
+        home = tempfile.TemporaryDirectory()
+        self.addCleanup(home.cleanup)
+        # Fresh singleton rooted in a temporary home directory
+        for patcher in (mock.patch.dict(os.environ, {"HOME": home.name, "USERPROFILE": home.name}),
+                        mock.patch.object(config_module, "_INSTANCE", None)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.config = MuninConfig()
+
+    def test_missing_sections_return_copies_of_defaults(self):
+        self.config._config.pop("activity_summary")
+        self.config._config.pop("ui_preferences")
+        expected_summary = dict(self.config.default_config["activity_summary"])
+        expected_ui = dict(self.config.default_config["ui_preferences"])
+
+        self.config.activity_summary_config["monthly_start_date"] = 15
+        self.config.ui_preferences["scan_timeout"] = 99.0
+
+        self.assertEqual(self.config.default_config["activity_summary"], expected_summary)
+        self.assertEqual(self.config.default_config["ui_preferences"], expected_ui)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import logging
+import unittest
+from unittest import mock
+
+from munin_client import logger as logger_module
+from munin_client.logger import MuninLogger
+
+
+class LogEventTests(unittest.TestCase):
+    def setUp(self):
+        # Skip file handler / log dir setup; assertLogs captures the records
+        patcher = mock.patch.object(logger_module, "_configured", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.logger = MuninLogger()
+
+    def test_positional_args_are_format_args(self):
+        with self.assertLogs(level="INFO") as captured:
+            self.logger.log_event("x %s", 1)
+        self.assertEqual(captured.records[0].levelno, logging.INFO)
+        self.assertEqual(captured.records[0].getMessage(), "x 1")
+
+    def test_level_is_keyword(self):
+        with self.assertLogs(level="WARNING") as captured:
+            self.logger.log_event("disk %s", "full", level="warning")
+        self.assertEqual(captured.records[0].levelno, logging.WARNING)
+        self.assertEqual(captured.records[0].getMessage(), "disk full")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -74,20 +74,25 @@ static ssize_t write_led(struct bt_conn *conn, const struct bt_gatt_attr *attr,
     if (offset != 0) {
         return BT_GATT_ERR(BT_ATT_ERR_INVALID_OFFSET);
     }
-    if (len != 4) {
+    /* One or more back-to-back 4-byte <face,r,g,b> entries (up to all 6 faces) */
+    if (len == 0 || (len % 4) != 0 || len > 4 * 6) {
         return BT_GATT_ERR(BT_ATT_ERR_INVALID_ATTRIBUTE_LEN);
     }
 
     const uint8_t *p = (const uint8_t *)buf;
-    uint8_t face = p[0];
-    if (face < 1 || face > 6) {
-        return BT_GATT_ERR(BT_ATT_ERR_VALUE_NOT_ALLOWED);
+    /* Validate every entry before applying any of them */
+    for (uint16_t i = 0; i < len; i += 4) {
+        if (p[i] < 1 || p[i] > 6) {
+            return BT_GATT_ERR(BT_ATT_ERR_VALUE_NOT_ALLOWED);
+        }
     }
 
-    /* Log receipt of face color configuration packet */
-    printk("cfg face=%u rgb=%u,%u,%u\n", face, p[1], p[2], p[3]);
     extern void munin_led_set_face_color(uint8_t face, uint8_t r, uint8_t g, uint8_t b);
-    munin_led_set_face_color(face, p[1], p[2], p[3]);
+    for (uint16_t i = 0; i < len; i += 4) {
+        /* Log receipt of face color configuration entry */
+        printk("cfg face=%u rgb=%u,%u,%u\n", p[i], p[i + 1], p[i + 2], p[i + 3]);
+        munin_led_set_face_color(p[i], p[i + 1], p[i + 2], p[i + 3]);
+    }
 
     /* Arm a debounced confirmation sweep; will start after a short idle */
     s_cseq.armed = true;